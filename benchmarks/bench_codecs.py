@@ -0,0 +1,83 @@
+"""
+Compares JSON codecs available to vk_botting on payloads recorded from VK API.
+
+Usage: python benchmarks/bench_codecs.py [number]
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vk_botting.codec import JSONCodec, OrjsonCodec, UjsonCodec
+from vk_botting.keyboard import Keyboard, KeyboardColor
+
+
+def _message(i):
+    return {
+        'date': 1634480000 + i, 'from_id': 123456 + i, 'id': 0, 'out': 0, 'peer_id': 2000000001,
+        'text': '[club1|@bot] !roll 1d20 Привет, как дела?', 'conversation_message_id': 4000 + i,
+        'fwd_messages': [], 'important': False, 'random_id': 0, 'is_hidden': False,
+        'attachments': [{'type': 'photo', 'photo': {
+            'album_id': -3, 'date': 1634480000, 'id': 457239017, 'owner_id': 123456, 'has_tags': False,
+            'access_key': 'a1b2c3d4e5f6', 'text': '',
+            'sizes': [{'height': h, 'url': 'https://sun9-1.userapi.com/impg/c858/v858/1/abcdef.jpg?size={}x{}'.format(h, h), 'type': t, 'width': h}
+                      for h, t in ((75, 's'), (130, 'm'), (604, 'x'), (807, 'y'), (1080, 'z'))]
+        }}]
+    }
+
+
+PAYLOADS = {
+    'longpoll': {'ts': '4118', 'updates': [{
+        'type': 'message_new', 'event_id': 'c8d1b5e7a3f4e2d1c0b9a8f7e6d5c4b3a2f1e0d9', 'group_id': 1, 'v': '5.131',
+        'object': {'message': _message(i), 'client_info': {
+            'button_actions': ['text', 'vkpay', 'open_app', 'location', 'open_link', 'callback', 'intent_subscribe', 'intent_unsubscribe'],
+            'keyboard': True, 'inline_keyboard': True, 'carousel': True, 'lang_id': 0}}
+    } for i in range(10)]},
+    'users.get': {'response': [{
+        'id': 123456 + i, 'first_name': 'Павел', 'last_name': 'Дуров', 'can_access_closed': True, 'is_closed': False,
+        'sex': 2, 'screen_name': 'id{}'.format(123456 + i), 'photo_50': 'https://sun9-1.userapi.com/s/v1/ig2/abcdef.jpg?size=50x50&quality=96&crop=0,0,400,400&ava=1',
+        'online': 0, 'city': {'id': 2, 'title': 'Санкт-Петербург'}, 'country': {'id': 1, 'title': 'Россия'}
+    } for i in range(100)]},
+    'messages.send': {'response': [{'peer_id': 2000000001, 'message_id': 0, 'conversation_message_id': 4001}]},
+}
+
+
+def _keyboard():
+    keyboard = Keyboard(inline=True)
+    for row in range(3):
+        for col in range(3):
+            keyboard.add_callback_button('Кнопка {}'.format(row * 3 + col), KeyboardColor.PRIMARY, payload={'command': 'press', 'button': row * 3 + col})
+        keyboard.add_line()
+    return keyboard.keyboard
+
+
+def _codecs():
+    codecs = [JSONCodec()]
+    for cls in (OrjsonCodec, UjsonCodec):
+        try:
+            codecs.append(cls())
+        except ImportError:
+            print('{} is not installed, skipping'.format(cls.name))
+    return codecs
+
+
+def main(number=2000):
+    encoded = {name: JSONCodec().dumps(payload).encode('utf-8') for name, payload in PAYLOADS.items()}
+    to_encode = dict(PAYLOADS, keyboard=_keyboard())
+    codecs = _codecs()
+    print('{:<16}{:>8}{:>14}{:>14}'.format('payload', 'codec', 'loads, us', 'dumps, us'))
+    for name in to_encode:
+        for codec in codecs:
+            if name in encoded:
+                loads = timeit.timeit(lambda: codec.loads(encoded[name]), number=number) / number * 1e6
+                loads = '{:.2f}'.format(loads)
+            else:
+                loads = '-'
+            dumps = timeit.timeit(lambda: codec.dumps(to_encode[name]), number=number) / number * 1e6
+            print('{:<16}{:>8}{:>14}{:>14.2f}'.format(name, codec.name, loads, dumps))
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,104 @@
+"""
+Measures cost of building messages from long-poll payloads, compared to eager parsing with a deep copy of the payload.
+
+Usage: python benchmarks/bench_messages.py [number]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+from copy import deepcopy
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vk_botting.attachments import get_attachment
+from vk_botting.bot import Bot
+from vk_botting.message import MessageAction
+
+
+def _message(i, depth=0):
+    message = {
+        'date': 1634480000 + i, 'from_id': 123456 + i, 'id': 0, 'out': 0, 'peer_id': 2000000001,
+        'text': '[club1|@bot] !roll 1d20 Привет, как дела?', 'conversation_message_id': 4000 + i,
+        'fwd_messages': [], 'important': False, 'random_id': 0, 'is_hidden': False,
+        'attachments': [{'type': 'photo', 'photo': {
+            'album_id': -3, 'date': 1634480000, 'id': 457239017 + j, 'owner_id': 123456, 'has_tags': False,
+            'access_key': 'a1b2c3d4e5f6', 'text': '',
+            'sizes': [{'height': h, 'url': 'https://sun9-1.userapi.com/impg/c858/v858/1/abcdef.jpg?size={}x{}'.format(h, h), 'type': t, 'width': h}
+                      for h, t in ((75, 's'), (130, 'm'), (604, 'x'), (807, 'y'), (1080, 'z'))]
+        }} for j in range(3)]
+    }
+    if depth < 2:
+        message['fwd_messages'] = [_message(i + j, depth + 1) for j in range(2)]
+        message['reply_message'] = _message(i, depth + 1)
+    return message
+
+
+class _EagerMessage:
+    # Message construction as it was done before fields became lazy
+
+    def __init__(self, data):
+        self.original_data = deepcopy(data)
+        self.id = data.get('id')
+        self.date = datetime.fromtimestamp(data.get('date', 86400))
+        self.update_time = datetime.fromtimestamp(data.get('update_time', 86400))
+        self.peer_id = data.get('peer_id')
+        self.from_id = data.get('from_id')
+        self.text = data.get('text')
+        self.attachments = data.get('attachments')
+        self.fwd_messages = data.get('fwd_messages')
+        self.reply_message = data.get('reply_message')
+        action = data.get('action')
+        self.action = MessageAction(action) if action else None
+        if self.attachments:
+            self.attachments = [get_attachment(attachment) for attachment in self.attachments]
+        if self.fwd_messages:
+            self.fwd_messages = [_EagerMessage(message) for message in self.fwd_messages]
+        if self.reply_message:
+            self.reply_message = _EagerMessage(self.reply_message)
+
+
+def _read(msg):
+    return msg.text, msg.peer_id, msg.from_id
+
+
+def _read_all(msg):
+    return _read(msg), msg.date, msg.attachments, [_read_all(fwd) for fwd in msg.fwd_messages or ()], msg.reply_message and _read_all(msg.reply_message)
+
+
+def _allocated(build, payloads):
+    tracemalloc.start()
+    messages = [build(payload) for payload in payloads]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del messages
+    return size / len(payloads)
+
+
+def main(number=5000):
+    bot = Bot(command_prefix='!')
+    payloads = [_message(i) for i in range(100)]
+    cases = {
+        'eager': lambda payload: _read(_EagerMessage(payload)),
+        'lazy': lambda payload: _read(bot.build_msg(payload)),
+        'lazy, all fields': lambda payload: _read_all(bot.build_msg(payload)),
+    }
+    builds = {
+        'eager': _EagerMessage,
+        'lazy': lambda payload: bot.build_msg(payload),
+    }
+    print('{:<20}{:>16}'.format('case', 'us per message'))
+    for name, case in cases.items():
+        per = timeit.timeit(lambda: [case(payload) for payload in payloads], number=number // 100) / number * 1e6
+        print('{:<20}{:>16.2f}'.format(name, per))
+    print()
+    print('{:<20}{:>16}'.format('case', 'bytes per message'))
+    for name, build in builds.items():
+        print('{:<20}{:>16.0f}'.format(name, _allocated(build, payloads)))
+    bot.loop.run_until_complete(bot.close())
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,92 @@
+"""
+Compares memory used by slot-based models with the same models keeping attributes in instance ``__dict__``.
+
+Usage: python benchmarks/bench_models.py [number]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vk_botting.attachments import Document, Photo, Video
+from vk_botting.bot import Bot
+from vk_botting.group import Group, Post, WallComment
+from vk_botting.message import Message
+from vk_botting.user import User
+
+from bench_messages import _message, _read_all
+
+USER = {
+    'id': 1, 'first_name': 'Павел', 'last_name': 'Дуров', 'can_access_closed': True, 'is_closed': False, 'sex': 2,
+    'screen_name': 'durov', 'bdate': '10.10.1984', 'city': {'id': 2, 'title': 'Санкт-Петербург'}, 'country': {'id': 1, 'title': 'Россия'},
+    'photo_50': 'https://sun9-1.userapi.com/s/v1/ig2/abcdef.jpg?size=50x50', 'photo_100': 'https://sun9-1.userapi.com/s/v1/ig2/abcdef.jpg?size=100x100',
+    'online': 0, 'domain': 'durov', 'has_mobile': 1, 'status': '', 'followers_count': 7000000, 'verified': 1
+}
+GROUP = {'id': 1, 'name': 'VK API', 'screen_name': 'apiclub', 'is_closed': 0, 'type': 'group',
+         'photo_50': 'https://sun9-1.userapi.com/50.jpg', 'photo_100': 'https://sun9-1.userapi.com/100.jpg', 'photo_200': 'https://sun9-1.userapi.com/200.jpg'}
+PHOTO = _message(0)['attachments'][0]['photo']
+VIDEO = {'id': 456239017, 'owner_id': -1, 'title': 'Video', 'duration': 120, 'date': 1634480000, 'views': 1000, 'comments': 10,
+         'player': 'https://vk.com/video_ext.php?oid=-1&id=456239017', 'can_add': 1, 'photo_320': 'https://sun9-1.userapi.com/320.jpg'}
+DOCUMENT = {'id': 1, 'owner_id': 1, 'title': 'file.pdf', 'size': 100000, 'ext': 'pdf', 'url': 'https://vk.com/doc1_1', 'date': 1634480000, 'type': 1}
+COMMENT = {'id': 1, 'from_id': 1, 'date': 1634480000, 'text': 'Комментарий', 'post_id': 1, 'post_owner_id': -1, 'parents_stack': [],
+           'thread': {'count': 0, 'items': [], 'can_post': True, 'show_reply_button': True}}
+POST = {'id': 1, 'from_id': -1, 'owner_id': -1, 'date': 1634480000, 'post_type': 'post', 'text': 'Пост', 'comments': {'count': 1},
+        'likes': {'count': 10, 'user_likes': 0, 'can_like': 1}, 'reposts': {'count': 1}, 'views': {'count': 100}}
+
+
+def _dict_based(cls):
+    # Same class without __slots__, the way models were defined before
+    namespace = {name: value for name, value in vars(cls).items() if name not in ('__slots__', '__dict__', '__weakref__')
+                 and not type(value).__name__ == 'member_descriptor'}
+    return type(cls.__name__, (), namespace)
+
+
+def _size(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _allocated(build, number):
+    tracemalloc.start()
+    objects = [build() for _ in range(number)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / number
+
+
+def main(number=10000):
+    bot = Bot(command_prefix='!')
+    message = _message(0)
+
+    def build_message(cls):
+        msg = cls(message)
+        msg.bot = bot
+        _read_all(msg)
+        return msg
+
+    cases = [
+        ('User', lambda cls: cls(bot, USER), User),
+        ('Group', lambda cls: cls(GROUP), Group),
+        ('Photo', lambda cls: cls(PHOTO), Photo),
+        ('Video', lambda cls: cls(VIDEO), Video),
+        ('Document', lambda cls: cls(DOCUMENT), Document),
+        ('WallComment', lambda cls: cls(COMMENT), WallComment),
+        ('Post', lambda cls: cls(POST), Post),
+        ('Message', build_message, Message),
+    ]
+    print('{:<14}{:>16}{:>16}{:>18}{:>18}'.format('model', 'object, before', 'object, after', 'allocated, before', 'allocated, after'))
+    for name, build, cls in cases:
+        before = _dict_based(cls)
+        print('{:<14}{:>16}{:>16}{:>18.0f}{:>18.0f}'.format(
+            name, _size(build(before)), _size(build(cls)), _allocated(lambda: build(before), number), _allocated(lambda: build(cls), number)
+        ))
+    bot.loop.run_until_complete(bot.close())
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:2]))
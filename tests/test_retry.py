@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from vk_botting.client import Client
+from vk_botting.exceptions import CircuitBreakerOpen
+from vk_botting.retry import CircuitBreaker, RetryPolicy
+
+URL = 'https://api.vk.com/method/users.get'
+
+
+class HangingRequest:
+    async def __aenter__(self):
+        await asyncio.Event().wait()
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class HangingSession:
+    def post(self, url, data=None):
+        return HangingRequest()
+
+    def get(self, url, params=None):
+        return HangingRequest()
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.recovery_timeout
+
+
+def test_check_returns_probe():
+    breaker = CircuitBreaker('api.vk.com', failure_threshold=1, recovery_timeout=30.0)
+    assert breaker.check() is False
+    open_breaker(breaker)
+    assert breaker.check() is True
+    with pytest.raises(CircuitBreakerOpen):
+        breaker.check()
+
+
+def test_cancelled_probe_reopens_breaker():
+    async def run():
+        client = Client(retry_policy=RetryPolicy(failure_threshold=1, recovery_timeout=30.0))
+        breaker = client.retry_policy.get_breaker(URL)
+        open_breaker(breaker)
+        assert breaker.state == 'half_open'
+        task = asyncio.ensure_future(client.general_request(URL, post=True, session=HangingSession()))
+        await asyncio.sleep(0)
+        assert breaker._probing
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not breaker._probing
+        assert breaker.state == 'open'
+        with pytest.raises(CircuitBreakerOpen) as exc:
+            breaker.check()
+        assert exc.value.retry_after > 0
+        breaker._opened_at -= breaker.recovery_timeout
+        assert breaker.check() is True
+        await client.close()
+
+    asyncio.new_event_loop().run_until_complete(run())
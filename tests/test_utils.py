@@ -0,0 +1,55 @@
+from vk_botting.utils import split_message, _utf16_len
+
+
+def test_short_text_is_not_split():
+    assert split_message('hello') == ['hello']
+    assert split_message('a' * 4096) == ['a' * 4096]
+
+
+def test_parts_fit_limit():
+    parts = split_message('word ' * 3000)
+    assert len(parts) > 1
+    assert all(_utf16_len(part) <= 4096 for part in parts)
+    assert ' '.join(parts) == ('word ' * 3000).strip()
+
+
+def test_text_without_separators():
+    parts = split_message('a' * 10000, limit=4096)
+    assert [len(part) for part in parts] == [4096, 4096, 1808]
+
+
+def test_surrogate_pairs_are_counted_and_not_split():
+    text = '\U0001F600' * 3000
+    parts = split_message(text)
+    assert all(_utf16_len(part) <= 4096 for part in parts)
+    assert ''.join(parts) == text
+    for part in parts:
+        part.encode('utf-16-le')
+
+
+def test_odd_limit_does_not_split_surrogate_pair():
+    parts = split_message('\U0001F600' * 10, limit=5)
+    assert parts == ['\U0001F600' * 2] * 5
+
+
+def test_whitespace_only_text():
+    assert split_message(' ' * 5000) == ['']
+    assert split_message('\n' * 9000, limit=100) == ['']
+
+
+def test_paragraph_boundary_is_preferred():
+    first = 'a' * 50 + '. ' + 'b' * 30
+    text = first + '\n\n' + 'c ' * 40
+    assert split_message(text, limit=100)[0] == first
+
+
+def test_sentence_boundary_is_preferred_over_word():
+    text = 'x ' * 30 + 'end. ' + 'y ' * 40
+    parts = split_message(text, limit=100)
+    assert parts[0].endswith('end.')
+
+
+def test_boundary_in_first_half_is_ignored():
+    text = 'a. ' + 'b' * 200
+    parts = split_message(text, limit=100)
+    assert len(parts[0]) == 100
@@ -21,6 +21,9 @@ import logging
 
 from vk_botting.bot import Bot, when_mentioned, when_mentioned_or, when_mentioned_or_pm, when_mentioned_or_pm_or, UserBot
 from vk_botting.client import UserMessageFlags
+from vk_botting.http import ConnectionConfig
+from vk_botting.journal import SendJournal
+from vk_botting.ratelimit import Priority
 from vk_botting.attachments import *
 from vk_botting.limiters import *
 from vk_botting.commands import *
@@ -44,7 +44,7 @@ class Messageable(metaclass=abc.ABCMeta):
     async def _get_conversation(self):
         raise NotImplementedError
 
-    async def send(self, message=None, *, attachment=None, sticker_id=None, keyboard=None, reply_to=None, forward_messages=None):
+    async def send(self, message=None, *, attachment=None, sticker_id=None, keyboard=None, reply_to=None, forward_messages=None, random_id=None, idempotency_key=None):
         """|coro|
 
         Sends a message to the destination with the text given.
@@ -72,6 +72,11 @@ class Messageable(metaclass=abc.ABCMeta):
             A message id to reply to.
         forward_messages: Union[List[:class:`int`], List[:class:`str`]]
             Message ids to be forwarded along with message.
+        random_id: :class:`int`
+            Unique id of the message used by VK to drop duplicates. Generated once per call if not passed.
+        idempotency_key: :class:`str`
+            Key to save the message in :attr:`.Bot.send_journal` under. Message sent with a key that is already
+            in the journal is not sent again, the saved message is returned instead.
 
         Raises
         --------
@@ -84,7 +89,8 @@ class Messageable(metaclass=abc.ABCMeta):
             The message that was sent.
         """
         peer_id = await self._get_conversation()
-        return await self.bot.send_message(peer_id, message, attachment=attachment, sticker_id=sticker_id, keyboard=keyboard, reply_to=reply_to, forward_messages=forward_messages)
+        return await self.bot.send_message(peer_id, message, attachment=attachment, sticker_id=sticker_id, keyboard=keyboard, reply_to=reply_to, forward_messages=forward_messages,
+                                           random_id=random_id, idempotency_key=idempotency_key)
 
     async def trigger_typing(self):
         """|coro|
@@ -119,6 +125,9 @@ class Messageable(metaclass=abc.ABCMeta):
             This is both a regular context manager and an async context manager.
             This means that both ``with`` and ``async with`` work with this.
 
+        Overlapping blocks in one conversation share typing state, which stops when the last of them exits
+        or a message is sent to the conversation.
+
         Example Usage: ::
 
             async with ctx.typing():
@@ -67,6 +67,7 @@ async def get_user_attachments(atts):
 
 
 class Document:
+    __slots__ = ('id', 'owner_id', 'title', 'size', 'ext', 'url', 'date', 'type', 'access_key')
 
     def __init__(self, data):
         self._unpack(data)
@@ -87,6 +88,7 @@ class Document:
 
 
 class AudioMessage:
+    __slots__ = ('id', 'owner_id', 'duration', 'waveform', 'link_ogg', 'link_mp3', 'access_key')
 
     def __init__(self, data):
         self._unpack(data)
@@ -102,6 +104,7 @@ class AudioMessage:
 
 
 class Sticker:
+    __slots__ = ('product_id', 'sticker_id', 'images', 'images_with_background')
 
     def __init__(self, data):
         self._unpack(data)
@@ -114,6 +117,7 @@ class Sticker:
 
 
 class Size:
+    __slots__ = ('type', 'url', 'width', 'height')
 
     def __init__(self, data):
         self._unpack(data)
@@ -126,6 +130,7 @@ class Size:
 
 
 class Photo:
+    __slots__ = ('id', 'album_id', 'owner_id', 'user_id', 'text', 'date', 'sizes', 'width', 'height')
 
     def __init__(self, data):
         self._unpack(data)
@@ -146,6 +151,7 @@ class Photo:
 
 
 class DeletedPhoto:
+    __slots__ = ('owner_id', 'id', 'user_id', 'deleter_id', 'photo_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -159,6 +165,7 @@ class DeletedPhoto:
 
 
 class Audio:
+    __slots__ = ('id', 'owner_id', 'artist', 'title', 'duration', 'url', 'lyrics_id', 'album_id', 'genre_id', 'date', 'no_search', 'is_hq')
 
     def __init__(self, data):
         self._unpack(data)
@@ -182,6 +189,12 @@ class Audio:
 
 
 class Video:
+    __slots__ = (
+        'id', 'owner_id', 'title', 'description', 'duration', 'photo_130', 'photo_320', 'photo_640', 'photo_800', 'photo_1280',
+        'first_frame_130', 'first_frame_320', 'first_frame_640', 'first_frame_800', 'first_frame_1280', 'date', 'adding_date', 'views',
+        'comments', 'player', 'platform', 'can_edit', 'can_add', 'is_private', 'access_key', 'processing', 'live', 'upcoming',
+        'is_favorite'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -222,6 +235,7 @@ class Video:
 
 
 class PollAnswer:
+    __slots__ = ('id', 'text', 'votes', 'rate')
 
     def __init__(self, data):
         self._unpack(data)
@@ -234,6 +248,10 @@ class PollAnswer:
 
 
 class Poll:
+    __slots__ = (
+        'id', 'owner_id', 'created', 'question', 'votes', 'answers', 'anonymous', 'multiple', 'answer_ids', 'end_date', 'closed',
+        'is_board', 'can_edit', 'can_vote', 'can_report', 'can_share', 'author_id'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -277,6 +295,8 @@ class Attachment:
         Type of an attachment. Can be value from :class:`.AttachmentType` enum.
     """
 
+    __slots__ = ('id', 'owner_id', 'type')
+
     def __init__(self, owner_id, _id, type):
         self.id = _id
         self.owner_id = owner_id
@@ -913,6 +913,73 @@ class Bot(BotBase, Client):
         If bot should force optimal longpoll settings automatically
     lang: :class:`str`
         Lang parameter for API requests
+    session: :class:`aiohttp.ClientSession`
+        Session to use for all HTTP requests. If not passed, separate connection pools are created
+        for API calls, long-poll requests and uploads
+    api_connection: :class:`.ConnectionConfig`
+        Settings of connection pool used for API calls
+    longpoll_connection: :class:`.ConnectionConfig`
+        Settings of connection pool used for long-poll requests
+    upload_connection: :class:`.ConnectionConfig`
+        Settings of connection pool used for uploads
+    batch_requests: :class:`bool`
+        If API calls made at the same time should be merged into ``execute`` requests (up to 25 calls per request).
+        Defaults to ``False``
+    batch_delay: :class:`float`
+        Seconds to wait for more calls before sending a batch. Defaults to 0.05
+    batch_size: :class:`int`
+        Maximum number of calls in one batch. Defaults to 25
+    cache_ttl: :class:`float`
+        Seconds :class:`.User` and :class:`.Group` instances returned by :meth:`.get_users`, :meth:`.get_groups`
+        and :meth:`.get_pages` are cached for. Defaults to 60, ``None`` disables caching
+    cache_size: :class:`int`
+        Maximum number of cached :class:`.User` and :class:`.Group` instances. Defaults to 10000
+    coalesce_requests: :class:`bool`
+        If identical read-only API calls made at the same time should share one request. Defaults to ``True``
+    coalesced_methods: Iterable[:class:`str`]
+        Read-only API methods that are safe to coalesce. Defaults to ``vk_botting.coalescing.COALESCED_METHODS``
+    ordered_sends: :class:`bool`
+        If messages sent to one peer should be delivered strictly in order they were sent in.
+        Messages to different peers are still sent in parallel. Defaults to ``False``
+    peer_send_rate: :class:`int`
+        Maximum number of messages sent to one peer per second when ``ordered_sends`` is enabled. Defaults to 3
+    retry_policy: :class:`.RetryPolicy`
+        Policy of retrying failed requests: exponential backoff with jitter, retry budget and per-host circuit breakers
+    send_journal: Union[:class:`str`, :class:`.SendJournal`]
+        Journal of messages sent with ``idempotency_key``, or path to the sqlite file to keep it in.
+        Defaults to journal kept in memory
+    group_rate_limit: :class:`int`
+        Maximum number of API calls per second made with group token. Calls above the limit wait for their turn.
+        Defaults to 20, ``None`` disables client-side rate limiting
+    user_rate_limit: :class:`int`
+        Maximum number of API calls per second made with user token. Defaults to 3, ``None`` disables client-side rate limiting
+    token_strategy: :class:`str`
+        How API calls are spread when several tokens are passed to :meth:`.Bot.run`.
+        Can be ``'least_loaded'`` (default) or ``'round_robin'``
+    longpoll_checkpoint: :class:`str`
+        Path to the file to save longpoll position to. On restart the bot continues from the saved position,
+        receiving events sent while it was stopped if VK still keeps them
+    dedup_ttl: :class:`float`
+        Number of seconds event ids are remembered for to drop events received twice. Defaults to 600, ``None`` disables deduplication
+    dedup_size: :class:`int`
+        Maximum number of event ids remembered. Defaults to 100000
+    max_concurrency: :class:`int`
+        Maximum number of event handlers running at the same time. Handlers over the limit are queued. Defaults to no limit
+    max_peer_concurrency: :class:`int`
+        Maximum number of handlers of events from one peer running at the same time. Defaults to no limit
+    max_queue: :class:`int`
+        Maximum number of queued event handlers. Defaults to 1000
+    overflow: :class:`str`
+        What to do when the queue is full: ``'block'`` pauses receiving updates, ``'drop_oldest'`` (default) drops the oldest queued handler,
+        ``'drop_events'`` drops handlers of ``shed_events`` first
+    shed_events: List[:class:`str`]
+        Names of events that may be dropped with ``'drop_events'`` policy, e.g. ``['on_message_typing_state']``
+    serialize_peers: :class:`bool`
+        If handlers of events from one peer should run one at a time in the order events were received.
+        Events from different peers are still handled in parallel. Handler at the head of the mailbox still waits for its slot
+        if ``max_concurrency`` is set, and can be dropped when the queue is full. Defaults to ``False``
+    mailbox_size: :class:`int`
+        Maximum number of event handlers waiting for their turn in one peer when ``serialize_peers`` is enabled. Defaults to 100
     """
     pass
 
@@ -972,5 +1039,45 @@ class UserBot(BotBase, UserClient):
         If bot should force optimal longpoll settings automatically
     lang: :class:`str`
         Lang parameter for API requests
+    session: :class:`aiohttp.ClientSession`
+        Session to use for all HTTP requests. If not passed, separate connection pools are created
+        for API calls, long-poll requests and uploads
+    api_connection: :class:`.ConnectionConfig`
+        Settings of connection pool used for API calls
+    longpoll_connection: :class:`.ConnectionConfig`
+        Settings of connection pool used for long-poll requests
+    upload_connection: :class:`.ConnectionConfig`
+        Settings of connection pool used for uploads
+    batch_requests: :class:`bool`
+        If API calls made at the same time should be merged into ``execute`` requests (up to 25 calls per request).
+        Defaults to ``False``
+    batch_delay: :class:`float`
+        Seconds to wait for more calls before sending a batch. Defaults to 0.05
+    batch_size: :class:`int`
+        Maximum number of calls in one batch. Defaults to 25
+    cache_ttl: :class:`float`
+        Seconds :class:`.User` and :class:`.Group` instances returned by :meth:`.get_users`, :meth:`.get_groups`
+        and :meth:`.get_pages` are cached for. Defaults to 60, ``None`` disables caching
+    cache_size: :class:`int`
+        Maximum number of cached :class:`.User` and :class:`.Group` instances. Defaults to 10000
+    coalesce_requests: :class:`bool`
+        If identical read-only API calls made at the same time should share one request. Defaults to ``True``
+    coalesced_methods: Iterable[:class:`str`]
+        Read-only API methods that are safe to coalesce. Defaults to ``vk_botting.coalescing.COALESCED_METHODS``
+    ordered_sends: :class:`bool`
+        If messages sent to one peer should be delivered strictly in order they were sent in.
+        Messages to different peers are still sent in parallel. Defaults to ``False``
+    peer_send_rate: :class:`int`
+        Maximum number of messages sent to one peer per second when ``ordered_sends`` is enabled. Defaults to 3
+    retry_policy: :class:`.RetryPolicy`
+        Policy of retrying failed requests: exponential backoff with jitter, retry budget and per-host circuit breakers
+    send_journal: Union[:class:`str`, :class:`.SendJournal`]
+        Journal of messages sent with ``idempotency_key``, or path to the sqlite file to keep it in.
+        Defaults to journal kept in memory
+    group_rate_limit: :class:`int`
+        Maximum number of API calls per second made with group token. Calls above the limit wait for their turn.
+        Defaults to 20, ``None`` disables client-side rate limiting
+    user_rate_limit: :class:`int`
+        Maximum number of API calls per second made with user token. Defaults to 3, ``None`` disables client-side rate limiting
     """
     pass
@@ -0,0 +1,290 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import sqlite3
+from collections.abc import Iterable
+from itertools import groupby, islice
+from random import getrandbits
+
+from vk_botting.exceptions import VKException
+from vk_botting.ratelimit import Priority
+from vk_botting.utils import to_json, from_json
+
+PEERS_PER_SEND = 100
+SENDS_PER_EXECUTE = 25
+
+
+class BroadcastResult:
+    """Represents outcome of a broadcast for one peer.
+
+    Attributes
+    ----------
+    peer_id: :class:`int`
+        Id of the peer
+    message_id: :class:`int`
+        Id of delivered message. Can be None
+    conversation_message_id: :class:`int`
+        Id of delivered message in conversation. Can be None
+    error_code: :class:`int`
+        Code of the error if message was not delivered, None otherwise
+    error: :class:`str`
+        Description of the error if message was not delivered, None otherwise
+    final: :class:`bool`
+        ``False`` if the whole request failed (e.g. with a temporary error), so sending to the peer can be tried again
+    """
+    __slots__ = ('peer_id', 'message_id', 'conversation_message_id', 'error_code', 'error', 'final')
+
+    def __init__(self, peer_id, message_id=None, conversation_message_id=None, error_code=None, error=None, final=True):
+        self.peer_id = peer_id
+        self.message_id = message_id
+        self.conversation_message_id = conversation_message_id
+        self.error_code = error_code
+        self.error = error
+        self.final = final
+
+    @property
+    def delivered(self):
+        """:class:`bool`: ``True`` if message was delivered to the peer"""
+        return self.error_code is None
+
+    def __repr__(self):
+        if self.delivered:
+            return '<BroadcastResult peer_id: {0.peer_id} delivered>'.format(self)
+        return '<BroadcastResult peer_id: {0.peer_id} error_code: {0.error_code}>'.format(self)
+
+
+def build_broadcast_params(message=None, attachment=None, sticker_id=None, keyboard=None, forward_messages=None, **kwargs):
+    if message is not None:
+        message = str(message)
+        if len(message) > 4096:
+            raise VKException('Broadcast message can not be longer than 4096 symbols')
+    if attachment is not None and not isinstance(attachment, str):
+        attachment = ','.join(map(str, attachment)) if isinstance(attachment, Iterable) else str(attachment)
+    params = dict(kwargs, message=message, attachment=attachment, sticker_id=sticker_id, keyboard=keyboard, forward_messages=forward_messages)
+    return params
+
+
+def chunk_peers(peers, size=PEERS_PER_SEND):
+    peers = iter(peers)
+    while True:
+        chunk = list(islice(peers, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _send_results(chunk, response, error):
+    if error is not None or not isinstance(response, list):
+        error = error or {}
+        return [BroadcastResult(peer_id, error_code=error.get('error_code', 0), error=error.get('error_msg', 'Unknown error'), final=False) for peer_id in chunk]
+    results = []
+    for item in response:
+        item_error = item.get('error')
+        if item_error:
+            results.append(BroadcastResult(item.get('peer_id'), error_code=item_error.get('code'), error=item_error.get('description')))
+        else:
+            results.append(BroadcastResult(item.get('peer_id'), item.get('message_id'), item.get('conversation_message_id')))
+    return results
+
+
+async def send_broadcast_request(client, chunks, params):
+    """Sends up to 25 chunks of peers in one ``execute`` call and returns list of :class:`BroadcastResult`
+
+    Every chunk is a tuple of random_id and list of peer ids. If the request fails, every peer gets a result
+    with ``final`` set to ``False`` instead of an exception being raised.
+    """
+    calls = []
+    for random_id, peers in chunks:
+        call_params = dict(params, peer_ids=peers, random_id=random_id, group_id=client.group.id)
+        calls.append('API.messages.send({})'.format(to_json(client._encode_params(call_params))))
+    try:
+        res = await client.vk_request('execute', code='return [{}];'.format(','.join(calls)), priority=Priority.BULK)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        # Request that failed after all retries must not stop the rest of the broadcast
+        res = {'error': {'error_code': 0, 'error_msg': '{}: {}'.format(exc.__class__.__name__, exc)}}
+    if 'error' in res:
+        return [result for _, peers in chunks for result in _send_results(peers, None, res['error'])]
+    responses = res.get('response') or []
+    errors = list(res.get('execute_errors', []))
+    results = []
+    for i, (_, peers) in enumerate(chunks):
+        response = responses[i] if i < len(responses) else False
+        error = errors.pop(0) if response is False and errors else None
+        results.extend(_send_results(peers, response, error))
+    return results
+
+
+async def run_broadcast_requests(client, requests, params, *, concurrency=2):
+    """Sends requests produced by ``requests`` iterable, keeping up to ``concurrency`` of them in flight.
+
+    Yields list of :class:`BroadcastResult` for every request as soon as it is done.
+    """
+    pending = set()
+    try:
+        for chunks in requests:
+            pending.add(client.loop.create_task(send_broadcast_request(client, chunks, params)))
+            if len(pending) < concurrency:
+                continue
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def broadcast(client, peers, params, *, concurrency=2):
+    requests = ([(getrandbits(31), chunk) for chunk in chunks] for chunks in chunk_peers(chunk_peers(peers), SENDS_PER_EXECUTE))
+    async for results in run_broadcast_requests(client, requests, params, concurrency=concurrency):
+        for result in results:
+            yield result
+
+
+_PENDING = 0
+_SENDING = 1
+_DELIVERED = 2
+_FAILED = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS peers (
+    peer_id INTEGER PRIMARY KEY,
+    status INTEGER NOT NULL DEFAULT 0,
+    random_id INTEGER,
+    message_id INTEGER,
+    error_code INTEGER
+);
+CREATE INDEX IF NOT EXISTS peers_status ON peers (status, random_id);
+"""
+
+
+class BroadcastJob:
+    """Broadcast that keeps its progress in a sqlite checkpoint file and can be resumed after restart.
+
+    Peers are marked as being sent before every request and as delivered or failed after it.
+    Peers that were being sent when the process stopped or whose request failed as a whole are sent again
+    by the next :meth:`run` with the same ``random_id``, so VK drops the duplicates,
+    and peers marked as delivered or failed are never sent to again.
+
+    Should be created with :meth:`.Bot.broadcast_job`.
+
+    Attributes
+    ----------
+    path: :class:`str`
+        Path to the checkpoint file
+    """
+
+    def __init__(self, client, path, params=None):
+        self.client = client
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if row is not None:
+            self.params = from_json(row[0])
+        elif params is not None:
+            self.params = client._encode_params(dict(params))
+            with self._db:
+                self._db.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (to_json(self.params),))
+        else:
+            self._db.close()
+            raise VKException('Checkpoint {} has no broadcast to resume'.format(path))
+
+    def add_peers(self, peers):
+        """Adds peers to the job. Peers that are already in the job keep their progress"""
+        with self._db:
+            self._db.executemany('INSERT OR IGNORE INTO peers (peer_id) VALUES (?)', ((int(peer_id),) for peer_id in peers))
+
+    def _requests(self):
+        chunks = []
+        interrupted = self._db.execute('SELECT random_id, peer_id FROM peers WHERE status = ? ORDER BY random_id', (_SENDING,)).fetchall()
+        for random_id, group in groupby(interrupted, key=lambda row: row[0]):
+            chunks.append((random_id, [row[1] for row in group]))
+            if len(chunks) == SENDS_PER_EXECUTE:
+                yield chunks
+                chunks = []
+        while True:
+            peers = [row[0] for row in self._db.execute('SELECT peer_id FROM peers WHERE status = ? LIMIT ?', (_PENDING, PEERS_PER_SEND))]
+            if not peers:
+                break
+            random_id = getrandbits(31)
+            with self._db:
+                self._db.executemany('UPDATE peers SET status = ?, random_id = ? WHERE peer_id = ?', ((_SENDING, random_id, peer_id) for peer_id in peers))
+            chunks.append((random_id, peers))
+            if len(chunks) == SENDS_PER_EXECUTE:
+                yield chunks
+                chunks = []
+        if chunks:
+            yield chunks
+
+    def _record(self, results):
+        # Peers of failed requests stay marked as being sent, so the next run sends them again with the same random_id
+        with self._db:
+            self._db.executemany('UPDATE peers SET status = ?, message_id = ?, error_code = ? WHERE peer_id = ?', (
+                (_DELIVERED if result.delivered else _FAILED, result.message_id, result.error_code, result.peer_id) for result in results if result.final
+            ))
+
+    async def run(self, *, concurrency=2):
+        """Sends the message to every peer that has not got it yet.
+
+        Returns an async iterator that yields :class:`.BroadcastResult` for every peer after its result is saved to the checkpoint.
+
+        Parameters
+        ----------
+        concurrency: :class:`int`
+            Number of ``execute`` requests made at the same time. Defaults to 2
+        """
+        async for results in run_broadcast_requests(self.client, self._requests(), self.params, concurrency=concurrency):
+            self._record(results)
+            for result in results:
+                yield result
+
+    @property
+    def progress(self):
+        """:class:`dict`: Number of peers that are ``pending``, being sent (``sending``), ``delivered`` and ``failed``"""
+        counts = dict(self._db.execute('SELECT status, COUNT(*) FROM peers GROUP BY status'))
+        return {
+            'pending': counts.get(_PENDING, 0),
+            'sending': counts.get(_SENDING, 0),
+            'delivered': counts.get(_DELIVERED, 0),
+            'failed': counts.get(_FAILED, 0)
+        }
+
+    @property
+    def done(self):
+        """:class:`bool`: ``True`` if every peer is either delivered or failed"""
+        progress = self.progress
+        return not (progress['pending'] or progress['sending'])
+
+    def close(self):
+        """Closes the checkpoint file"""
+        self._db.close()
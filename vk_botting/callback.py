@@ -0,0 +1,130 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import hmac
+import sys
+import traceback
+
+from aiohttp import web
+
+from vk_botting.exceptions import VKApiError
+from vk_botting.utils import from_json
+
+
+class CallbackServer:
+    """HTTP server receiving events from VK Callback API.
+
+    Answers confirmation requests, checks secret key of every request and replies ``ok`` as soon as
+    the event is passed to :meth:`.Client.handle_update`, so handlers run after VK gets the answer.
+
+    Server is stateless, so several instances of the bot can be put behind a load balancer.
+
+    Should be started with :meth:`.Bot.run_callback`.
+
+    Attributes
+    ----------
+    app: :class:`aiohttp.web.Application`
+        Application that handles callback requests. Can be mounted into your own application instead of starting the server
+    """
+
+    def __init__(self, client, *, host='0.0.0.0', port=8080, path='/', secret=None, confirmation=None):
+        self.client = client
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secret = secret
+        self.confirmation = confirmation
+        self.app = web.Application()
+        self.app.router.add_post(path, self.handle)
+        self._runner = None
+        self._received = 0
+        self._rejected = 0
+
+    async def get_confirmation(self):
+        if self.confirmation is None:
+            res = await self.client.vk_request('groups.getCallbackConfirmationCode', group_id=self.client.group.id)
+            if 'error' in res:
+                raise VKApiError('[{error_code}] {error_msg}'.format(**res['error']))
+            self.confirmation = res['response']['code']
+        return self.confirmation
+
+    def _check_secret(self, secret):
+        if not isinstance(secret, str):
+            return False
+        return hmac.compare_digest(secret.encode('utf-8'), str(self.secret).encode('utf-8'))
+
+    async def handle(self, request):
+        try:
+            update = from_json(await request.read())
+        except ValueError:
+            self._rejected += 1
+            return web.Response(status=400, text='bad request')
+        if not isinstance(update, dict) or 'type' not in update:
+            self._rejected += 1
+            return web.Response(status=400, text='bad request')
+        if self.secret is not None and not self._check_secret(update.get('secret')):
+            self._rejected += 1
+            return web.Response(status=403, text='forbidden')
+        if self.client.group is not None and update.get('group_id') != self.client.group.id:
+            self._rejected += 1
+            return web.Response(status=403, text='forbidden')
+        if update['type'] == 'confirmation':
+            return web.Response(text=await self.get_confirmation())
+        self._received += 1
+        try:
+            self.client.handle_update(update)
+        except Exception:
+            print('Ignoring exception in callback update:', file=sys.stderr)
+            traceback.print_exc()
+        if self.client.governor is not None:
+            await self.client.governor.wait()
+        return web.Response(text='ok')
+
+    async def start(self):
+        """|coro|
+
+        Starts listening on :attr:`host` and :attr:`port`.
+        """
+        await self.get_confirmation()
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+
+    async def stop(self):
+        """|coro|
+
+        Stops the server.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @property
+    def stats(self):
+        return {
+            'received': self._received,
+            'rejected': self._rejected
+        }
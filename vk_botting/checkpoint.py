@@ -0,0 +1,65 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+
+from vk_botting.utils import to_json, from_json
+
+
+class LongpollCheckpoint:
+    """Keeps longpoll position of every group in a JSON file, so events sent while the bot was stopped
+    can be received after restart.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        Path to the checkpoint file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._saved = {}
+        try:
+            with open(path, 'rb') as f:
+                self._saved = from_json(f.read())
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            self._saved = {}
+
+    def load(self, group_id):
+        """Returns :class:`dict` with ``ts``, ``key`` and ``server`` saved for the group, or ``None``"""
+        return self._saved.get(str(group_id))
+
+    def save(self, group_id, ts, key, server):
+        """Saves position of the group. File is replaced atomically, so it is never left half-written"""
+        saved = {'ts': ts, 'key': key, 'server': server}
+        if self._saved.get(str(group_id)) == saved:
+            return
+        self._saved[str(group_id)] = saved
+        tmp = '{}.tmp'.format(self.path)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(to_json(self._saved))
+        os.replace(tmp, self.path)
@@ -25,25 +25,44 @@ DEALINGS IN THE SOFTWARE.
 
 import asyncio
 import enum
+import multiprocessing
 import os
 import sys
-import textwrap
 import traceback
 from collections.abc import Iterable
-from json import dumps
+from functools import partial
 from random import getrandbits
 
 import aiohttp
 
 from vk_botting.attachments import Photo, Video, Audio
-from vk_botting.attachments import get_attachment, get_user_attachments, DocType, Attachment, AttachmentType
-from vk_botting.exceptions import VKApiError, LoginError, VKException
+from vk_botting.attachments import get_user_attachments, DocType, Attachment, AttachmentType
+from vk_botting.broadcast import broadcast, build_broadcast_params, BroadcastJob
+from vk_botting.cache import TTLCache
+from vk_botting.callback import CallbackServer
+from vk_botting.checkpoint import LongpollCheckpoint
+from vk_botting.coalescing import RequestCoalescer, COALESCED_METHODS
+from vk_botting.context_managers import TypingScheduler
+from vk_botting.dedup import SeenEvents
+from vk_botting.exceptions import VKApiError, LoginError, VKException, CircuitBreakerOpen
+from vk_botting.execute import ExecuteBatcher
 from vk_botting.general import convert_params
+from vk_botting.governor import Governor
 from vk_botting.group import *
+from vk_botting.hosting import HostedGroup, _HostedAttribute, contextvars, get_current_group, set_current_group
+from vk_botting.http import HTTPSessions
+from vk_botting.journal import SendJournal
+from vk_botting.loaders import BatchLoader
+from vk_botting.mailbox import Mailboxes
 from vk_botting.message import Message, UserMessage, MessageEvent
+from vk_botting.outbox import Outbox
+from vk_botting.ratelimit import RateLimiter, Priority, get_priority
+from vk_botting.retry import RetryPolicy
+from vk_botting.sharding import get_shard, open_reader, open_writer
 from vk_botting.states import State
+from vk_botting.tokens import TokenPool
 from vk_botting.user import BlockedUser, UnblockedUser, User
-from vk_botting.utils import maybe_coroutine, to_json
+from vk_botting.utils import maybe_coroutine, to_json, from_json, split_message
 
 
 class UserMessageFlags(enum.IntFlag):
@@ -62,6 +81,22 @@ class UserMessageFlags(enum.IntFlag):
     NotDelivered = 262144
 
 
+def _fields_key(fields):
+    if fields is None or isinstance(fields, str):
+        return fields
+    return ','.join(sorted(map(str, fields)))
+
+
+def _is_start_payload(payload):
+    if payload == '{"command":"start"}':
+        return True
+    try:
+        payload = from_json(payload)
+    except ValueError:
+        return False
+    return isinstance(payload, dict) and payload.get('command') == 'start'
+
+
 class _ClientEventTask(asyncio.Task):
     def __init__(self, original_coro, event_name, coro, *, loop):
         super().__init__(coro, loop=loop)
@@ -88,6 +123,11 @@ class Client:
 
     """
 
+    token = _HostedAttribute('token')
+    group = _HostedAttribute('group')
+    key = _HostedAttribute('key')
+    server = _HostedAttribute('server')
+
     def __init__(self, **kwargs):
         self.v = kwargs.get('v', '5.131')
         self.force = kwargs.get('force', False)
@@ -98,15 +138,50 @@ class Client:
         self.key = None
         self.server = None
         self._listeners = {}
-        timeout = aiohttp.ClientTimeout(total=100, connect=10)
         user_agent = kwargs.get('user_agent', None)
-        if user_agent:
-            headers = {
-                'User-Agent': user_agent
-            }
-            self.session = kwargs.get('session', aiohttp.ClientSession(timeout=timeout, headers=headers))
+        headers = {'User-Agent': user_agent} if user_agent else None
+        self._http_options = {'session': kwargs.get('session'), 'headers': headers, 'api': kwargs.get('api_connection'),
+                              'longpoll': kwargs.get('longpoll_connection'), 'upload': kwargs.get('upload_connection')}
+        self.http = HTTPSessions(**self._http_options)
+        self.session = self.http.api
+        self._loaders = {}
+        cache_ttl = kwargs.get('cache_ttl', 60)
+        self.page_cache = TTLCache(kwargs.get('cache_size', 10000), cache_ttl) if cache_ttl else None
+        if kwargs.get('coalesce_requests', True):
+            self.coalescer = RequestCoalescer(kwargs.get('coalesced_methods', COALESCED_METHODS), loop=self.loop)
         else:
-            self.session = kwargs.get('session', aiohttp.ClientSession(timeout=timeout))
+            self.coalescer = None
+        self.token_pool = None
+        self.token_strategy = kwargs.get('token_strategy', 'least_loaded')
+        if kwargs.get('ordered_sends', False):
+            self.outbox = Outbox(loop=self.loop, rate=kwargs.get('peer_send_rate', 3))
+        else:
+            self.outbox = None
+        self.retry_policy = kwargs.get('retry_policy') or RetryPolicy()
+        self.typing_scheduler = TypingScheduler(self)
+        self.callback_server = None
+        self.hosted_groups = []
+        self.workers = []
+        if kwargs.get('max_concurrency') or kwargs.get('max_peer_concurrency'):
+            self.governor = Governor(loop=self.loop, max_concurrency=kwargs.get('max_concurrency'), max_peer_concurrency=kwargs.get('max_peer_concurrency'),
+                                     max_queue=kwargs.get('max_queue', 1000), overflow=kwargs.get('overflow', 'drop_oldest'),
+                                     shed_events=kwargs.get('shed_events', ()))
+        else:
+            self.governor = None
+        self.mailboxes = Mailboxes(loop=self.loop, max_size=kwargs.get('mailbox_size', 100)) if kwargs.get('serialize_peers', False) else None
+        dedup_ttl = kwargs.get('dedup_ttl', 600)
+        self.seen_events = SeenEvents(dedup_ttl, maxsize=kwargs.get('dedup_size', 100000)) if dedup_ttl else None
+        checkpoint = kwargs.get('longpoll_checkpoint')
+        self.longpoll_checkpoint = LongpollCheckpoint(checkpoint) if isinstance(checkpoint, str) else checkpoint
+        send_journal = kwargs.get('send_journal')
+        self.send_journal = SendJournal(send_journal) if isinstance(send_journal, str) else send_journal
+        self.group_rate_limit = kwargs.get('group_rate_limit', 20)
+        self.user_rate_limit = kwargs.get('user_rate_limit', 3)
+        self.limiter = RateLimiter(loop=self.loop, default_rate=self.group_rate_limit)
+        if kwargs.get('batch_requests', False):
+            self.batcher = ExecuteBatcher(self, delay=kwargs.get('batch_delay', 0.05), size=kwargs.get('batch_size', 25))
+        else:
+            self.batcher = None
         self._all_events = ['message_new', 'message_event', 'message_reply', 'message_allow', 'message_deny', 'message_edit', 'message_typing_state', 'photo_new', 'audio_new', 'video_new', 'wall_reply_new', 'wall_reply_edit', 'wall_reply_delete', 'wall_reply_restore', 'wall_post_new', 'wall_repost', 'board_post_new', 'board_post_edit', 'board_post_restore', 'board_post_delete', 'photo_comment_new', 'photo_comment_edit', 'photo_comment_delete', 'photo_comment_restore', 'video_comment_new', 'video_comment_edit', 'video_comment_delete', 'video_comment_restore', 'market_comment_new', 'market_comment_edit', 'market_comment_delete', 'market_comment_restore', 'poll_vote_new', 'group_join', 'group_leave', 'group_change_settings', 'group_change_photo', 'group_officers_edit', 'user_block', 'user_unblock']
         self.extra_events = []
         self.token = None
@@ -240,41 +315,79 @@ class Client:
         listeners.append((future, check))
         return asyncio.wait_for(future, timeout)
 
-    async def general_request(self, url, post=False, **params):
+    async def general_request(self, url, post=False, session=None, **params):
         params = convert_params(params)
-        for tries in range(5):
+        if session is None:
+            session = self.session
+        policy = self.retry_policy
+        breaker = policy.get_breaker(url)
+        policy.budget.record_request()
+        attempt = 0
+        while True:
+            probe = breaker.check()
             try:
-                req = self.session.post(url, data=params) if post else self.session.get(url, params=params)
+                req = session.post(url, data=params) if post else session.get(url, params=params)
                 async with req as r:
                     if r.content_type == 'application/json':
-                        return await r.json()
-                    return await r.text()
+                        res = from_json(await r.read())
+                    else:
+                        res = await r.text()
+                    if r.status >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                    return res
+            except asyncio.CancelledError:
+                if probe:
+                    # Unfinished probe counts as failed, otherwise the breaker would stay half-open forever
+                    breaker.record_failure()
+                raise
             except Exception as e:
-                print('Got exception in request: {}\nRetrying in {} seconds'.format(e, tries*2+1), file=sys.stderr)
-                await asyncio.sleep(tries*2+1)
-
-    async def _vk_request(self, method, post, calln=1, **kwargs):
-        if calln > 10:
-            raise VKApiError('VK API call failed after 10 retries')
-        for param in kwargs:
-            if isinstance(kwargs[param], (list, tuple)):
-                kwargs[param] = ','.join(map(str, kwargs[param]))
-            elif isinstance(kwargs[param], dict):
-                kwargs[param] = to_json(kwargs[param])
-        res = await self.general_request('https://api.vk.com/method/{}'.format(method), post=post, **kwargs)
-        if isinstance(res, str):
-            await asyncio.sleep(0.1)
-            return await self._vk_request(method, post, calln+1, **kwargs)
-        error = res.get('error', None)
-        if error and error.get('error_code', None) == 6:
-            await asyncio.sleep(1)
-            return await self._vk_request(method, post, calln+1, **kwargs)
-        elif error and error.get('error_code', None) == 10 and 'could not check access_token now' in error.get('error_msg', ''):
-            await asyncio.sleep(0.1)
-            return await self._vk_request(method, post, calln+1, **kwargs)
-        return res
-
-    async def vk_request(self, method, post=True, **kwargs):
+                breaker.record_failure()
+                if not policy.can_retry(attempt):
+                    raise
+                delay = policy.backoff(attempt)
+                print('Got exception in request: {}\nRetrying in {:.2f} seconds'.format(e, delay), file=sys.stderr)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    @staticmethod
+    def _encode_params(params):
+        for param in params:
+            if isinstance(params[param], (list, tuple)):
+                params[param] = ','.join(map(str, params[param]))
+            elif isinstance(params[param], dict):
+                params[param] = to_json(params[param])
+        return convert_params(params)
+
+    async def _send_vk_request(self, method, post, priority, **kwargs):
+        policy = self.retry_policy
+        token = kwargs.get('access_token')
+        attempt = 0
+        while True:
+            await self.limiter.acquire(token, priority)
+            res = await self.general_request('https://api.vk.com/method/{}'.format(method), post=post, session=self.http.api, **kwargs)
+            error = res.get('error', None) if isinstance(res, dict) else None
+            code = error.get('error_code', None) if error else None
+            if code == 6:
+                self.limiter.drain(token)
+            elif isinstance(res, dict) and not (code == 10 and 'could not check access_token now' in error.get('error_msg', '')):
+                return res
+            if not policy.can_retry(attempt, policy.api_attempts):
+                if isinstance(res, dict):
+                    return res
+                raise VKApiError('VK API call failed after {} attempts'.format(attempt + 1))
+            await asyncio.sleep(policy.backoff(attempt))
+            attempt += 1
+
+    async def _vk_request(self, method, post, priority=None, **kwargs):
+        kwargs = self._encode_params(kwargs)
+        priority = get_priority(method, priority)
+        if self.batcher is not None and self.batcher.can_batch(method):
+            return await self.batcher.request(method, post, kwargs, priority)
+        return await self._send_vk_request(method, post, priority, **kwargs)
+
+    async def vk_request(self, method, post=True, priority=None, **kwargs):
         """|coro|
 
         Implements abstract VK Api method request.
@@ -285,6 +398,9 @@ class Client:
             String representation of method name (e.g. 'users.get')
         post: :class:`bool`
             If request should be POST. Defaults to true. Changing this is not recommended
+        priority: :class:`.Priority`
+            Priority class of the call, used when calls have to wait for rate limit.
+            By default is chosen by method, e.g. messages.send is :attr:`.Priority.INTERACTIVE`
         kwargs: :class:`Any`
             Payload arguments to send along with request
 
@@ -297,9 +413,23 @@ class Client:
         :class:`dict`
             Dict representation of json response received from the server
         """
-        return await self._vk_request(method, post, **self.Payload(**kwargs))
-
-    async def user_vk_request(self, method, post=True, **kwargs):
+        if self.coalescer is not None and self.coalescer.can_coalesce(method):
+            key = (self.token, method, post, frozenset(self._encode_params(dict(kwargs)).items()))
+            return await self.coalescer.request(key, partial(self._group_vk_request, method, post, priority, **kwargs))
+        return await self._group_vk_request(method, post, priority, **kwargs)
+
+    async def _group_vk_request(self, method, post, priority, **kwargs):
+        if self.token_pool is None or get_current_group() is not None:
+            return await self._vk_request(method, post, priority, **self.Payload(**kwargs))
+        while True:
+            with self.token_pool.use() as token:
+                payload = self.Payload(**kwargs)
+                payload['access_token'] = token
+                res = await self._vk_request(method, post, priority, **payload)
+            if not self.token_pool.check(token, res):
+                return res
+
+    async def user_vk_request(self, method, post=True, priority=None, **kwargs):
         """|coro|
 
         Implements abstract VK Api method request with attached User token.
@@ -310,6 +440,9 @@ class Client:
             String representation of method name (e.g. 'users.get')
         post: :class:`bool`
             If request should be POST. Defaults to true. Changing this is not recommended
+        priority: :class:`.Priority`
+            Priority class of the call, used when calls have to wait for rate limit.
+            By default is chosen by method, e.g. messages.send is :attr:`.Priority.INTERACTIVE`
         kwargs: :class:`Any`
             Payload arguments to send along with request
 
@@ -322,7 +455,148 @@ class Client:
         :class:`dict`
             Dict representation of json response received from the server
         """
-        return await self._vk_request(method, post, **self.UserPayload(**kwargs))
+        return await self._vk_request(method, post, priority, **self.UserPayload(**kwargs))
+
+    @property
+    def rate_limit_stats(self):
+        """:class:`dict`: Queue depth and wait time statistics of client-side rate limiting for every used token.
+
+        Keys are the last 6 symbols of tokens, values are dicts with ``queued``, ``acquired``, ``delayed``,
+        ``total_wait``, ``max_wait`` and ``average_wait`` keys
+        """
+        return self.limiter.stats
+
+    @property
+    def token_pool_stats(self):
+        """:class:`dict`: Health and load of every token in the pool, empty if bot was started with one token"""
+        if self.token_pool is None:
+            return {}
+        return self.token_pool.stats
+
+    @property
+    def coalescing_stats(self):
+        """:class:`dict`: Number of API calls that shared a request with an identical call in flight (``hits``) and that did not (``misses``)"""
+        if self.coalescer is None:
+            return {}
+        return self.coalescer.stats
+
+    @property
+    def cache_stats(self):
+        """:class:`dict`: Size, hit and miss counts of :class:`.User` and :class:`.Group` cache"""
+        if self.page_cache is None:
+            return {}
+        return self.page_cache.stats
+
+    def invalidate_pages(self, *ids):
+        """Removes cached :class:`.User` and :class:`.Group` instances for given ids.
+
+        Ids follow the same rules as in :meth:`.get_pages`: negative ids are groups, positive are users.
+        If no ids are passed, whole cache is cleared.
+        """
+        if self.page_cache is None:
+            return
+        if not ids:
+            return self.page_cache.clear()
+        ids = set(map(int, ids))
+        self.page_cache.invalidate_where(lambda key: key[0] in ids)
+
+    def _split_cached_pages(self, ids, sign, variant):
+        if not ids:
+            return None, []
+        try:
+            ids = [int(pid) for pid in ids]
+        except (TypeError, ValueError):
+            return None, list(ids)
+        if self.page_cache is None:
+            return {}, ids
+        found = {}
+        missing = []
+        for pid in ids:
+            page = self.page_cache.get((sign * pid, variant))
+            if page is None:
+                missing.append(pid)
+            else:
+                found[pid] = page
+        return found, missing
+
+    def _get_loader(self, method, variant):
+        try:
+            return self._loaders[method, variant]
+        except KeyError:
+            pass
+        if method == 'users.get':
+            fields, name_case = variant
+
+            async def batch_load(uids):
+                users = await self._request_users(uids, fields, name_case)
+                self._cache_pages(users, 1, variant)
+                return {user.id: user for user in users}
+            max_batch_size = 1000
+        else:
+            async def batch_load(gids):
+                groups = await self._request_groups(gids)
+                self._cache_pages(groups, -1, variant)
+                return {group.id: group for group in groups}
+            max_batch_size = 500
+        loader = self._loaders[method, variant] = BatchLoader(batch_load, loop=self.loop, max_batch_size=max_batch_size)
+        return loader
+
+    def _cache_pages(self, pages, sign, variant):
+        if self.page_cache is None:
+            return
+        for page in pages:
+            self.page_cache.set((sign * page.id, variant), page)
+
+    @property
+    def http_stats(self):
+        """:class:`dict`: Request counts and connection reuse statistics of ``api``, ``longpoll`` and ``upload`` connection pools"""
+        return self.http.stats
+
+    @property
+    def retry_stats(self):
+        """:class:`dict`: Retry budget usage and state of circuit breaker of every host"""
+        return self.retry_policy.stats
+
+    @property
+    def outbox_stats(self):
+        """:class:`dict`: Number of messages waiting to be sent to every peer, empty if ``ordered_sends`` is disabled"""
+        if self.outbox is None:
+            return {}
+        return self.outbox.stats
+
+    @property
+    def governor_stats(self):
+        """:class:`dict`: Number of running, queued, started and dropped event handlers and number of times receiving updates was paused,
+        empty if concurrency is not limited"""
+        if self.governor is None:
+            return {}
+        return self.governor.stats
+
+    @property
+    def mailbox_stats(self):
+        """:class:`dict`: Number of peer mailboxes, queued, processed and dropped event handlers, empty if ``serialize_peers`` is disabled"""
+        if self.mailboxes is None:
+            return {}
+        return self.mailboxes.stats
+
+    @property
+    def dedup_stats(self):
+        """:class:`dict`: Number of duplicate and unique events received and number of event ids remembered, empty if deduplication is disabled"""
+        if self.seen_events is None:
+            return {}
+        return self.seen_events.stats
+
+    @property
+    def callback_stats(self):
+        """:class:`dict`: Number of events received and requests rejected by Callback API server, empty if it is not used"""
+        if self.callback_server is None:
+            return {}
+        return self.callback_server.stats
+
+    @property
+    def typing_stats(self):
+        """:class:`dict`: Number of peers with typing state kept, number of active :meth:`.typing` blocks and number of ``messages.setActivity`` calls made"""
+        return self.typing_scheduler.stats
 
     async def get_users(self, *uids, fields=None, name_case=None):
         """|coro|
@@ -350,11 +624,26 @@ class Client:
         """
         if name_case is None:
             name_case = 'nom'
-        users = await self.vk_request('users.get', user_ids=uids, fields=fields, name_case=name_case)
-        if 'error' in users.keys():
-            raise VKApiError('[{error_code}] {error_msg}'.format(**users['error']))
-        users = users.get('response')
-        return [User(self, user) for user in users]
+        variant = (_fields_key(fields), name_case)
+        found, missing = self._split_cached_pages(uids, 1, variant)
+        if found is None:
+            users = await self._request_users(uids, fields, name_case)
+            self._cache_pages(users, 1, variant)
+            return users
+        if missing:
+            loader = self._get_loader('users.get', variant)
+            found.update((user.id, user) for user in await loader.load_many(missing) if user is not None)
+        return [found[uid] for uid in map(int, uids) if uid in found]
+
+    async def _request_users(self, uids, fields, name_case):
+        chunks = [uids[i:i + 1000] for i in range(0, len(uids), 1000)] or [()]
+        responses = await asyncio.gather(*[self.vk_request('users.get', user_ids=chunk, fields=fields, name_case=name_case) for chunk in chunks])
+        users = []
+        for res in responses:
+            if 'error' in res.keys():
+                raise VKApiError('[{error_code}] {error_msg}'.format(**res['error']))
+            users.extend(User(self, user) for user in res.get('response'))
+        return users
 
     async def get_groups(self, *gids):
         """|coro|
@@ -376,11 +665,25 @@ class Client:
         List[:class:`.Group`]
             List of :class:`.Group` instances for requested groups
         """
-        groups = await self.vk_request('groups.getById', group_ids=','.join(map(str, gids)))
-        if 'error' in groups.keys():
-            raise VKApiError('[{error_code}] {error_msg}'.format(**groups['error']))
-        groups = groups.get('response')
-        return [Group(group) for group in groups]
+        found, missing = self._split_cached_pages(gids, -1, None)
+        if found is None:
+            groups = await self._request_groups(gids)
+            self._cache_pages(groups, -1, None)
+            return groups
+        if missing:
+            loader = self._get_loader('groups.getById', None)
+            found.update((group.id, group) for group in await loader.load_many(missing) if group is not None)
+        return [found[gid] for gid in map(int, gids) if gid in found]
+
+    async def _request_groups(self, gids):
+        chunks = [gids[i:i + 500] for i in range(0, len(gids), 500)] or [()]
+        responses = await asyncio.gather(*[self.vk_request('groups.getById', group_ids=','.join(map(str, chunk))) for chunk in chunks])
+        groups = []
+        for res in responses:
+            if 'error' in res.keys():
+                raise VKApiError('[{error_code}] {error_msg}'.format(**res['error']))
+            groups.extend(Group(group) for group in res.get('response'))
+        return groups
 
     async def get_pages(self, *ids, fields=None, name_case=None):
         """|coro|
@@ -406,32 +709,17 @@ class Client:
         List[Union[:class:`.Group`, :class:`.User`]]
             List of :class:`.Group` or :class:`.User` instances for requested ids
         """
-        g = []
-        u = []
-        for pid in ids:
-            if pid < 0:
-                g.append(-pid)
-            else:
-                u.append(pid)
-        users = await self.get_users(*u, fields=fields, name_case=name_case)
-        groups = await self.get_groups(*g)
-        res = []
-        for pid in ids:
-            if pid < 0:
-                for group in groups:
-                    if -pid == group.id:
-                        res.append(group)
-                        break
-                else:
-                    res.append(None)
-            else:
-                for user in users:
-                    if pid == user.id:
-                        res.append(user)
-                        break
-                else:
-                    res.append(None)
-        return res
+        g = [-pid for pid in ids if pid < 0]
+        u = [pid for pid in ids if pid >= 0]
+        requests = []
+        if u:
+            requests.append(self.get_users(*u, fields=fields, name_case=name_case))
+        if g:
+            requests.append(self.get_groups(*g))
+        pages = {}
+        for result in await asyncio.gather(*requests):
+            pages.update((-page.id if isinstance(page, Group) else page.id, page) for page in result)
+        return [pages.get(pid) for pid in ids]
 
     async def get_user(self, uid, fields=None, name_case=None):
         """|coro|
@@ -586,7 +874,7 @@ class Client:
         if filename:
             files = {'photo': open(filename, 'rb')}
         elif url:
-            imbts = await self.session.get(url)
+            imbts = await self.http.upload.get(url)
             cnt = imbts.content_type
             if not cnt.startswith('image/'):
                 raise TypeError('URL passed does not lead to an image')
@@ -597,8 +885,8 @@ class Client:
         else:
             files = aiohttp.FormData()
             files.add_field('photo', raw, filename='temp.{}'.format(format.lower()))
-        server_response = await self.session.post(server, data=files)
-        response_json = await server_response.json(content_type=None)
+        server_response = await self.http.upload.post(server, data=files)
+        response_json = from_json(await server_response.read())
         return response_json
 
     async def upload_document(self, peer_id, file, type=DocType.DOCUMENT, title=None):
@@ -629,8 +917,8 @@ class Client:
         r = await self.vk_request('docs.getMessagesUploadServer', peer_id=peer_id, type=type)
         imurl = r['response']['upload_url']
         files = {'file': open(file, 'rb')}
-        r = await self.session.post(imurl, data=files)
-        r = await r.json()
+        r = await self.http.upload.post(imurl, data=files)
+        r = from_json(await r.read())
         filedata = r['file']
         if title is None:
             title = os.path.splitext(file)[0]
@@ -688,14 +976,6 @@ class Client:
             :class:`.Message` instance representing original object
         """
         res = Message(msg)
-        if res.attachments:
-            for i in range(len(res.attachments)):
-                res.attachments[i] = get_attachment(res.attachments[i])
-        if res.fwd_messages:
-            for i in range(len(res.fwd_messages)):
-                res.fwd_messages[i] = self.build_msg(res.fwd_messages[i])
-        if res.reply_message:
-            res.reply_message = self.build_msg(res.reply_message)
         res.bot = self
         return res
 
@@ -739,20 +1019,47 @@ class Client:
         if not self.is_group:
             payload['mode'] = 10
         try:
-            res = await self.general_request(self.server, **payload)
+            res = await self.general_request(self.server, session=self.http.longpoll, **payload)
         except asyncio.TimeoutError:
             return ts, []
-        if 'ts' not in res.keys() or 'failed' in res.keys():
-            ts = await self.get_longpoll_server()
+        failed = res.get('failed')
+        if failed == 2:
+            # Only the key has expired, events after ts can still be received with a new one
+            await self.get_longpoll_server()
+        elif failed == 1 and 'ts' in res.keys():
+            self._report_gap(ts, res['ts'])
+            ts = res['ts']
+        elif failed:
+            new_ts = await self.get_longpoll_server()
+            self._report_gap(ts, new_ts)
+            ts = new_ts
+        elif 'ts' not in res.keys():
+            await self.get_longpoll_server()
         else:
             ts = res['ts']
         updates = res.get('updates', [])
         return ts, updates
 
+    def _report_gap(self, ts, new_ts):
+        print('WARNING:  Longpoll history is lost, events between ts {} and {} will not be received'.format(ts, new_ts), file=sys.stderr)
+        self.dispatch('longpoll_gap', ts, new_ts)
+
+    async def _start_longpoll(self):
+        saved = self.longpoll_checkpoint.load(self.group.id) if self.longpoll_checkpoint is not None else None
+        if saved is None:
+            return await self.get_longpoll_server()
+        self.key = saved['key']
+        self.server = saved['server']
+        return saved['ts']
+
+    def _save_longpoll(self, ts):
+        if self.longpoll_checkpoint is not None:
+            self.longpoll_checkpoint.save(self.group.id, ts, self.key, self.server)
+
     def handle_message(self, message):
         msg = self.build_msg(message)
         payload = message.get('payload')
-        if payload and payload == '{"command":"start"}':
+        if payload and _is_start_payload(payload):
             return self.dispatch('conversation_start', msg)
         action = msg.action
         if action:
@@ -863,6 +1170,9 @@ class Client:
         return self.dispatch(t, edit)
 
     def handle_update(self, update):
+        event_id = update.get('event_id')
+        if self.seen_events is not None and event_id is not None and self.seen_events.seen(event_id):
+            return
         t = update['type']
         obj = update['object']
         on_t = 'on_{}'.format(t)
@@ -872,7 +1182,7 @@ class Client:
         if t == 'message_new':
             return self.handle_message(obj['message'])
         elif t in self.event_handlers and used:
-            return self.loop.create_task(maybe_coroutine(self.event_handlers[t], t, obj))
+            return self._schedule_event(partial(maybe_coroutine, self.event_handlers[t]), on_t, t, obj)
         elif t not in self.event_handlers and unknown_used:
             return self.dispatch('unknown', update)
 
@@ -939,9 +1249,40 @@ class Client:
                 pass
 
     def _schedule_event(self, coro, event_name, *args, **kwargs):
+        peer_id = getattr(args[0], 'peer_id', None) if args else None
+        if peer_id is not None and self.hosted_groups:
+            peer_id = (self.group.id, peer_id)
+        if self.mailboxes is not None and peer_id is not None:
+            if self.governor is not None:
+                return self.mailboxes.submit(peer_id, partial(self._run_governed, peer_id, coro, event_name, *args, **kwargs))
+            return self.mailboxes.submit(peer_id, partial(self._run_event, coro, event_name, *args, **kwargs))
+        if self.governor is not None:
+            return self.governor.submit(peer_id, event_name, partial(self._start_event, coro, event_name, *args, **kwargs))
+        return self._start_event(coro, event_name, *args, **kwargs)
+
+    def _start_event(self, coro, event_name, *args, **kwargs):
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
         return _ClientEventTask(original_coro=coro, event_name=event_name, coro=wrapped, loop=self.loop)
 
+    async def _run_governed(self, peer_id, coro, event_name, *args, **kwargs):
+        # Handler at the head of a mailbox takes a slot of the governor, so global limits hold for serialized peers too
+        started = self.loop.create_future()
+
+        def start():
+            task = self._start_event(coro, event_name, *args, **kwargs)
+            if not started.done():
+                started.set_result(task)
+            return task
+
+        def drop():
+            if not started.done():
+                started.set_result(None)
+
+        self.governor.submit(peer_id, event_name, start, drop)
+        task = await started
+        if task is not None:
+            await task
+
     async def send_message(self, peer_id=None, message=None, attachment=None, sticker_id=None, keyboard=None, reply_to=None, forward_messages=None, forward=None, **kwargs):
         """|coro|
 
@@ -952,6 +1293,9 @@ class Client:
         If the content is set to ``None`` (the default), then the ``attachment`` or ``sticker_id`` parameter must
         be provided.
 
+        Text longer than 4096 symbols is split into several messages, preferably at paragraph and sentence boundaries.
+        They are sent in order in one ``execute`` request, and the attachments are sent with the last one.
+
         If the ``attachment`` parameter is provided, it must be :class:`str`, List[:class:`str`], :class:`.Attachment` or List[:class:`.Attachment`]
 
         If the ``keyboard`` parameter is provided, it must be :class:`str` or :class:`.Keyboard` (recommended)
@@ -976,6 +1320,12 @@ class Client:
             Check docs for more details on this one.
         as_user: :class:`bool`
             If message should be sent as user (using attached user token).
+        random_id: :class:`int`
+            Unique id of the message used by VK to drop duplicates. Generated once per call and reused
+            on every retry if not passed.
+        idempotency_key: :class:`str`
+            Key to save the message in :attr:`send_journal` under. Message sent with a key that is already
+            in the journal is not sent again, the saved message is returned instead.
 
         Raises
         --------
@@ -987,7 +1337,16 @@ class Client:
         :class:`.Message`
             The message that was sent.
         """
+        if self.outbox is not None and isinstance(peer_id, int):
+            key = (self.group.id, peer_id) if self.hosted_groups else peer_id
+            return await self.outbox.submit(key, partial(self._send_message, peer_id, message, attachment, sticker_id, keyboard, reply_to,
+                                                             forward_messages, forward, **kwargs))
+        return await self._send_message(peer_id, message, attachment, sticker_id, keyboard, reply_to, forward_messages, forward, **kwargs)
+
+    async def _send_message(self, peer_id, message, attachment, sticker_id, keyboard, reply_to, forward_messages, forward, **kwargs):
         as_user = kwargs.pop('as_user', False)
+        random_id = kwargs.pop('random_id', None)
+        idempotency_key = kwargs.pop('idempotency_key', None)
         if kwargs:
             print('Unknown parameters passed to send_message: {}'.format(', '.join(kwargs.keys())), file=sys.stderr)
         if isinstance(attachment, str) or attachment is None:
@@ -996,28 +1355,40 @@ class Client:
             attachment = ','.join(map(str, attachment))
         else:
             attachment = str(attachment)
-        if message:
-            message = str(message)
-            if len(message) > 4096:
-                w = textwrap.TextWrapper(width=4096, replace_whitespace=False)
-                messages = w.wrap(message)
-                for message in messages[:-1]:
-                    await self.send_message(peer_id, message, **kwargs)
-                return await self.send_message(peer_id, messages[-1], attachment=attachment, sticker_id=sticker_id, keyboard=keyboard, reply_to=reply_to, forward_messages=forward_messages, **kwargs)
-        params = {'random_id': getrandbits(64), 'message': message, 'attachment': attachment,
-                  'reply_to': reply_to, 'forward_messages': forward_messages, 'sticker_id': sticker_id, 'keyboard': keyboard, 'forward': forward}
-        if self.is_group and not as_user:
-            params['group_id'] = self.group.id
-            params['peer_ids'] = peer_id
+        parts = split_message(str(message)) if message else [message]
+        if idempotency_key is not None:
+            if self.send_journal is None:
+                self.send_journal = SendJournal()
+            sent = self.send_journal.get(idempotency_key)
+            if sent is None:
+                random_id = self.send_journal.reserve(idempotency_key, random_id if random_id is not None else getrandbits(31))
+            elif sent[1] is not None:
+                return self.build_msg(sent[1])
+            else:
+                random_id = sent[0]
+        elif random_id is None:
+            random_id = getrandbits(31)
+        calls = [{'random_id': (random_id + i) & 0x7fffffff, 'message': part} for i, part in enumerate(parts)]
+        params = calls[-1]
+        params.update({'attachment': attachment, 'reply_to': reply_to, 'forward_messages': forward_messages, 'sticker_id': sticker_id,
+                       'keyboard': keyboard, 'forward': forward})
+        for call in calls:
+            if self.is_group and not as_user:
+                call['group_id'] = self.group.id
+                call['peer_ids'] = peer_id
+            else:
+                call['peer_id'] = peer_id
+        if len(calls) > 1:
+            res = await self._send_in_order(calls, as_user)
         else:
-            params['peer_id'] = peer_id
-        res = await self.vk_request('messages.send', **params) if not as_user else await self.user_vk_request('messages.send', **params)
-        if 'error' in res.keys():
-            if res['error'].get('error_code') == 9:
+            while True:
+                res = await self.vk_request('messages.send', **params) if not as_user else await self.user_vk_request('messages.send', **params)
+                if 'error' not in res.keys():
+                    break
+                if res['error'].get('error_code') != 9:
+                    raise VKApiError('[{error_code}] {error_msg}'.format(**res['error']))
                 await asyncio.sleep(1)
-                return await self.send_message(peer_id, message, attachment=attachment, sticker_id=sticker_id,
-                                               keyboard=keyboard, reply_to=reply_to, forward_messages=forward_messages, **kwargs)
-            raise VKApiError('[{error_code}] {error_msg}'.format(**res['error']))
+        self.typing_scheduler.message_sent(peer_id)
         if self.is_group and not as_user:
             params['from_id'] = -self.group.id
             params['conversation_message_id'] = res['response'][0]['conversation_message_id']
@@ -1027,8 +1398,135 @@ class Client:
         else:
             params['from_id'] = self.user.id
             params['id'] = res['response']
+        if idempotency_key is not None:
+            self.send_journal.complete(idempotency_key, self._encode_params(dict(params)))
         return self.build_msg(params)
 
+    async def _send_in_order(self, calls, as_user):
+        request = self.user_vk_request if as_user else self.vk_request
+        res = None
+        while calls:
+            batch = calls[:25]
+            code = ''.join('r=API.messages.send({});if(!r){{return [{},r];}}'.format(to_json(self._encode_params(dict(call))), i)
+                           for i, call in enumerate(batch))
+            res = await request('execute', code='var r;{}return [{},r];'.format(code, len(batch)), priority=Priority.INTERACTIVE)
+            if 'error' in res:
+                error = res['error']
+                sent = 0
+            else:
+                sent, response = res['response']
+                errors = res.get('execute_errors') or [{'error_code': 0, 'error_msg': 'Unknown error'}]
+                error = errors[-1] if sent < len(batch) else None
+                res = {'response': response}
+            calls = calls[sent:] if error is not None else calls[len(batch):]
+            if error is None:
+                continue
+            if error.get('error_code') != 9:
+                raise VKApiError('[{error_code}] {error_msg}'.format(**error))
+            await asyncio.sleep(1)
+        return res
+
+    def broadcast(self, peers, message=None, *, attachment=None, sticker_id=None, keyboard=None, forward_messages=None, concurrency=2, **kwargs):
+        """Sends the same message to many peers with as few API calls as possible.
+
+        Peers are packed by 100 into one messages.send call, and 25 such calls are made in one ``execute`` request.
+        Requests are made with :attr:`.Priority.BULK`, so they honor rate limits and give way to replies to users.
+
+        Returns an async iterator that yields :class:`.BroadcastResult` for every peer as soon as its batch is sent.
+
+        Example
+        -------
+
+        .. code-block:: python3
+
+            async for result in bot.broadcast(subscribers, 'Weekly news!'):
+                if not result.delivered:
+                    print(result.peer_id, result.error_code)
+
+        Parameters
+        ----------
+        peers: Iterable[:class:`int`]
+            Ids of peers to send message to. Can be any iterable, it is consumed lazily
+        message: :class:`str`
+            The text of the message to send. Can not be longer than 4096 symbols
+        attachment: Union[List[:class:`str`], :class:`str`, List[:class:`.Attachment`], :class:`.Attachment`]
+            The attachment to the message sent.
+        sticker_id: Union[:class:`str`, :class:`int`]
+            Sticker_id to be sent.
+        keyboard: :class:`.Keyboard`
+            The keyboard to send along message.
+        forward_messages: Union[List[:class:`int`], List[:class:`str`]]
+            Message ids to be forwarded along with message.
+        concurrency: :class:`int`
+            Number of ``execute`` requests made at the same time. Defaults to 2
+        kwargs: :class:`Any`
+            Other parameters of messages.send
+
+        Raises
+        --------
+        vk_botting.VKException
+            When used without group token or message is too long.
+        """
+        if not self.is_group:
+            raise VKException('Broadcasts can only be sent with group token')
+        params = build_broadcast_params(message, attachment, sticker_id, keyboard, forward_messages, **kwargs)
+        return broadcast(self, peers, params, concurrency=concurrency)
+
+    def broadcast_job(self, path, peers=None, message=None, *, attachment=None, sticker_id=None, keyboard=None, forward_messages=None, **kwargs):
+        """Creates a broadcast that keeps its progress in a checkpoint file, or opens an existing one to resume it.
+
+        Unlike :meth:`.broadcast`, the job survives restarts: run it again with the same ``path``
+        and it will only send the message to peers that have not got it yet.
+
+        Example
+        -------
+
+        .. code-block:: python3
+
+            job = bot.broadcast_job('mailing.sqlite', subscribers, 'Weekly news!')
+            async for result in job.run():
+                pass
+            job.close()
+
+        Parameters
+        ----------
+        path: :class:`str`
+            Path to the checkpoint file. Message parameters saved in an existing file take precedence over passed ones
+        peers: Iterable[:class:`int`]
+            Ids of peers to add to the job. Can be omitted when resuming
+        message: :class:`str`
+            The text of the message to send. Can not be longer than 4096 symbols
+        attachment: Union[List[:class:`str`], :class:`str`, List[:class:`.Attachment`], :class:`.Attachment`]
+            The attachment to the message sent.
+        sticker_id: Union[:class:`str`, :class:`int`]
+            Sticker_id to be sent.
+        keyboard: :class:`.Keyboard`
+            The keyboard to send along message.
+        forward_messages: Union[List[:class:`int`], List[:class:`str`]]
+            Message ids to be forwarded along with message.
+        kwargs: :class:`Any`
+            Other parameters of messages.send
+
+        Raises
+        --------
+        vk_botting.VKException
+            When used without group token, message is too long, or checkpoint file has no job and no message is passed.
+
+        Returns
+        -------
+        :class:`.BroadcastJob`
+            Job to be started with :meth:`.BroadcastJob.run`
+        """
+        if not self.is_group:
+            raise VKException('Broadcasts can only be sent with group token')
+        params = None
+        if message is not None or attachment is not None or sticker_id is not None or forward_messages is not None:
+            params = build_broadcast_params(message, attachment, sticker_id, keyboard, forward_messages, **kwargs)
+        job = BroadcastJob(self, path, params)
+        if peers is not None:
+            job.add_peers(peers)
+        return job
+
     async def add_user_token(self, token):
         """|coro|
         Alternative for :meth:`.Client.attach_user_token`"""
@@ -1047,12 +1545,35 @@ class Client:
             User token to attach
         """
         self.user_token = token
+        self.limiter.set_rate(token, self.user_rate_limit)
         user = await self.get_own_user_page()
         if user is None:
             self.user_token = None
             raise VKException('Invalid user token')
         self.user = user
 
+    async def _restart_longpoll(self, get_server):
+        attempt = 0
+        while True:
+            try:
+                return await get_server()
+            except CircuitBreakerOpen as e:
+                delay = max(e.retry_after, self.retry_policy.base_delay)
+            except Exception as e:
+                delay = self.retry_policy.backoff(attempt)
+                print('Failed to restart longpoll: {}\nRetrying in {:.2f} seconds'.format(e, delay), file=sys.stderr)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def close(self):
+        """|coro|
+
+        Closes all HTTP sessions used by the client and stops Callback API server.
+        """
+        if self.callback_server is not None:
+            await self.callback_server.stop()
+        await self.http.close()
+
     async def _run(self, owner_id):
         if owner_id and owner_id.__class__ is not int:
             raise TypeError('Owner_id must be positive integer, not {0.__class__.__name__}'.format(owner_id))
@@ -1064,21 +1585,234 @@ class Client:
             self.group = user
             if self.is_group and owner_id:
                 raise VKApiError('Owner_id passed together with group access_token')
-            ts = await self.get_longpoll_server()
+            ts = await self._start_longpoll()
             await self.print_warnings()
             self.dispatch('ready')
-            updates = []
-            while True:
-                try:
-                    lp = self.loop.create_task(self.longpoll(ts))
-                    for update in updates:
-                        self.handle_update(update)
-                    ts, updates = await lp
-                except Exception as e:
-                    print('Ignoring exception in longpoll cycle:\n{}'.format(e), file=sys.stderr)
-                    ts = await self.get_longpoll_server()
+            await self._poll(ts)
         raise LoginError('User token passed to group client')
 
+    async def _poll(self, ts):
+        updates = []
+        while True:
+            try:
+                lp = self.loop.create_task(self.longpoll(ts))
+                for update in updates:
+                    self.handle_update(update)
+                self._save_longpoll(ts)
+                if self.governor is not None:
+                    await self.governor.wait()
+                ts, updates = await lp
+            except Exception as e:
+                print('Ignoring exception in longpoll cycle:\n{}'.format(e), file=sys.stderr)
+                lp.cancel()
+                updates = []
+                # Only the server is refreshed, events after ts are still received, real history loss is reported by longpoll
+                await self._restart_longpoll(self.get_longpoll_server)
+
+    async def _connect_hosted(self, hosted):
+        set_current_group(hosted)
+        group = await self.get_own_page()
+        if not isinstance(group, Group):
+            raise LoginError('User token passed to run_groups')
+        self.group = group
+        ts = await self._start_longpoll()
+        await self.print_warnings()
+        return ts
+
+    async def _poll_hosted(self, hosted, ts):
+        set_current_group(hosted)
+        await self._poll(ts)
+
+    async def _run_groups(self):
+        self.is_group = True
+        timestamps = await asyncio.gather(*[self._connect_hosted(hosted) for hosted in self.hosted_groups])
+        self.group = self.hosted_groups[0].group
+        self.dispatch('ready')
+        await asyncio.gather(*[self._poll_hosted(hosted, ts) for hosted, ts in zip(self.hosted_groups, timestamps)])
+
+    def _use_loop(self, loop):
+        # Rebinds the client to a new event loop in a forked worker process
+        self.loop = loop
+        self.http = HTTPSessions(**self._http_options)
+        self.session = self.http.api
+        self._loaders = {}
+        self.limiter = RateLimiter(loop=loop, default_rate=self.group_rate_limit)
+        if self.coalescer is not None:
+            self.coalescer = RequestCoalescer(self.coalescer.methods, loop=loop)
+        if self.outbox is not None:
+            self.outbox = Outbox(loop=loop, rate=self.outbox.rate, per=self.outbox.per)
+        if self.mailboxes is not None:
+            self.mailboxes = Mailboxes(loop=loop, max_size=self.mailboxes.max_size)
+        if self.governor is not None:
+            self.governor.loop = loop
+        if self.send_journal is not None:
+            # sqlite connections must not be used across fork
+            self.send_journal = SendJournal(self.send_journal.path, ttl=self.send_journal.ttl)
+
+    async def _login_group(self):
+        group = await self.get_own_page()
+        if not isinstance(group, Group):
+            raise LoginError('User token passed to group client')
+        self.is_group = True
+        self.group = group
+
+    async def _ingest(self, token, fds):
+        writers = [await open_writer(fd, loop=self.loop) for fd in fds]
+        await self._login_group()
+        ts = await self._start_longpoll()
+        await self.print_warnings()
+        while True:
+            try:
+                ts, updates = await self.longpoll(ts)
+            except Exception as e:
+                print('Ignoring exception in longpoll cycle:\n{}'.format(e), file=sys.stderr)
+                await self._restart_longpoll(self.get_longpoll_server)
+                continue
+            batches = {}
+            for update in updates:
+                event_id = update.get('event_id')
+                if self.seen_events is not None and event_id is not None and self.seen_events.seen(event_id):
+                    continue
+                shard = get_shard(update, len(writers))
+                batches.setdefault(shard, []).append(to_json(update).encode('utf-8') + b'\n')
+            for shard, lines in batches.items():
+                await self._feed_worker(token, shard, fds, writers, b''.join(lines))
+            self._save_longpoll(ts)
+
+    async def _feed_worker(self, token, shard, fds, writers, data):
+        attempt = 0
+        while True:
+            try:
+                writers[shard].write(data)
+                await writers[shard].drain()
+                return
+            except ConnectionError as e:
+                delay = self.retry_policy.backoff(attempt)
+                print('Worker {} is gone: {}\nRestarting it in {:.2f} seconds'.format(shard, e, delay), file=sys.stderr)
+            writers[shard].close()
+            process = self.workers[shard]
+            if process.is_alive():
+                process.kill()
+            process.join()
+            await asyncio.sleep(delay)
+            inherited = [fd for index, fd in enumerate(fds) if index != shard]
+            self.workers[shard], fds[shard] = self._start_worker(token, shard, len(fds), inherited)
+            writers[shard] = await open_writer(fds[shard], loop=self.loop)
+            attempt += 1
+
+    async def _work(self, fd):
+        reader = await open_reader(fd, loop=self.loop)
+        await self._login_group()
+        self.dispatch('ready')
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                self.handle_update(from_json(line))
+            except Exception:
+                print('Ignoring exception in update handling:', file=sys.stderr)
+                traceback.print_exc()
+            if self.governor is not None:
+                await self.governor.wait()
+
+    def _run_worker(self, token, fd, fds, shard, workers):
+        for other in fds:
+            os.close(other)
+        if self.group_rate_limit:
+            # Workers share the rate limit of the token, so together they never exceed it
+            rate, extra = divmod(self.group_rate_limit, workers)
+            self.group_rate_limit = rate + (shard < extra)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._use_loop(loop)
+        self._set_token(token)
+        loop.run_until_complete(self._work(fd))
+
+    def _start_worker(self, token, shard, workers, inherited):
+        read_fd, write_fd = os.pipe()
+        context = multiprocessing.get_context('fork')
+        process = context.Process(target=self._run_worker, args=(token, read_fd, inherited + [write_fd], shard, workers), daemon=True)
+        process.start()
+        os.close(read_fd)
+        return process, write_fd
+
+    def run_sharded(self, token, workers=None):
+        """A blocking call that starts the bot in several processes.
+
+        Current process receives updates from longpoll and passes them to ``workers`` worker processes,
+        each of them handling updates with its own event loop. All updates of one conversation
+        are handled by the same worker, so they stay in order.
+
+        Workers are forked from the current process, so everything registered before this call
+        (commands, cogs, listeners) is available in them. Worker that dies is started again.
+
+        ``group_rate_limit`` is split between workers, so together they do not exceed it,
+        which also limits number of workers to it.
+
+        .. warning::
+            This function must be the last function to call due to the fact that it
+            is blocking. That means that registration of events or anything being
+            called after this function call will not execute until it returns.
+
+        .. note::
+            Only available on platforms that support ``fork``, and can not be used with custom ``session``
+
+        Parameters
+        ----------
+        token: Union[:class:`str`, List[:class:`str`]]
+            Group token. Can also be a list of group tokens, API calls will then be spread across all of them
+        workers: :class:`int`
+            Number of worker processes. Defaults to number of CPUs
+        """
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise VKException('Sharded mode requires fork support')
+        if self._http_options['session'] is not None:
+            raise VKException('Sharded mode can not be used with custom session')
+        workers = workers or os.cpu_count() or 1
+        if self.group_rate_limit:
+            workers = min(workers, self.group_rate_limit)
+        self.workers = []
+        fds = []
+        for shard in range(workers):
+            process, fd = self._start_worker(token, shard, workers, list(fds))
+            self.workers.append(process)
+            fds.append(fd)
+        self._set_token(token)
+        self.loop.create_task(self._ingest(token, fds))
+        self.loop.run_forever()
+
+    def run_groups(self, tokens):
+        """A blocking call that starts the bot in several groups at once.
+
+        Every group has its own longpoll, while connections, rate limiter, caches, commands and cogs are shared.
+        While an event is handled, :attr:`group` and API calls refer to the group the event came from,
+        so the same handlers serve all groups.
+
+        .. warning::
+            This function must be the last function to call due to the fact that it
+            is blocking. That means that registration of events or anything being
+            called after this function call will not execute until it returns.
+
+        .. note::
+            Requires Python 3.7 or newer
+
+        Parameters
+        ----------
+        tokens: List[:class:`str`]
+            Group tokens, one for every group
+        """
+        if contextvars is None:
+            raise VKException('Hosting several groups requires Python 3.7 or newer')
+        if not tokens:
+            raise VKException('No group tokens passed')
+        self.hosted_groups = [HostedGroup(token) for token in tokens]
+        for token in tokens:
+            self.limiter.set_rate(token, self.group_rate_limit)
+        self.token = tokens[0]
+        self.loop.create_task(self._run_groups())
+        self.loop.run_forever()
+
     def run(self, token, owner_id=None):
         """A blocking call that abstracts away the event loop
         initialisation from you.
@@ -1090,15 +1824,65 @@ class Client:
 
         Parameters
         ----------
-        token: :class:`str`
-            Bot token. Should be group token or user token with access to group
+        token: Union[:class:`str`, List[:class:`str`]]
+            Bot token. Should be group token or user token with access to group.
+            Can also be a list of group tokens, API calls will then be spread across all of them
         owner_id: :class:`int`
             Should only be passed alongside user token. Owner id of group to connect to
         """
-        self.token = token
+        self._set_token(token)
         self.loop.create_task(self._run(owner_id))
         self.loop.run_forever()
 
+    def _set_token(self, token):
+        if isinstance(token, (list, tuple)):
+            self.token_pool = TokenPool(token, strategy=self.token_strategy)
+            token = self.token_pool.tokens[0]
+            for pooled in self.token_pool.tokens:
+                self.limiter.set_rate(pooled, self.group_rate_limit)
+        self.token = token
+        self.limiter.set_rate(token, self.group_rate_limit)
+
+    async def _run_callback(self, server):
+        user = await self.get_own_page()
+        if not isinstance(user, Group):
+            raise LoginError('Callback API can only be used with group token')
+        self.is_group = True
+        self.group = user
+        await server.start()
+        self.dispatch('ready')
+
+    def run_callback(self, token, *, host='0.0.0.0', port=8080, path='/', secret=None, confirmation=None):
+        """A blocking call that starts the bot receiving events from Callback API instead of longpoll.
+
+        VK pushes events to the server, which answers ``ok`` right away and runs handlers in the background.
+        Server address should be set in group settings, and the events needed should be enabled there.
+
+        .. warning::
+            This function must be the last function to call due to the fact that it
+            is blocking. That means that registration of events or anything being
+            called after this function call will not execute until it returns.
+
+        Parameters
+        ----------
+        token: Union[:class:`str`, List[:class:`str`]]
+            Group token. Can also be a list of group tokens, API calls will then be spread across all of them
+        host: :class:`str`
+            Host to listen on. Defaults to ``'0.0.0.0'``
+        port: :class:`int`
+            Port to listen on. Defaults to 8080
+        path: :class:`str`
+            Path VK sends requests to. Defaults to ``'/'``
+        secret: :class:`str`
+            Secret key set in group settings. Requests without it are rejected
+        confirmation: :class:`str`
+            String to answer confirmation requests with. Requested from VK if not passed
+        """
+        self._set_token(token)
+        self.callback_server = CallbackServer(self, host=host, port=port, path=path, secret=secret, confirmation=confirmation)
+        self.loop.create_task(self._run_callback(self.callback_server))
+        self.loop.run_forever()
+
 
 class UserClient(Client):
 
@@ -1135,7 +1919,7 @@ class UserClient(Client):
         if not self.is_group:
             payload['mode'] = 10
         try:
-            res = await self.general_request(self.server, **payload)
+            res = await self.general_request(self.server, session=self.http.longpoll, **payload)
         except asyncio.TimeoutError:
             return ts, []
         if 'ts' not in res.keys() or 'failed' in res.keys():
@@ -1183,7 +1967,7 @@ class UserClient(Client):
                     ts, updates = await lp
                 except Exception as e:
                     print('Ignoring exception in longpoll cycle:\n{}'.format(e), file=sys.stderr)
-                    ts = await self.get_user_longpoll()
+                    ts = await self._restart_longpoll(self.get_user_longpoll)
         raise LoginError('Group token passed to user client')
 
     def run(self, token, owner_id=None):
@@ -1204,5 +1988,6 @@ class UserClient(Client):
         """
         self.token = token
         self.user_token = token
+        self.limiter.set_rate(token, self.user_rate_limit)
         self.loop.create_task(self._run(owner_id))
         self.loop.run_forever()
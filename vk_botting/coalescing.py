@@ -0,0 +1,89 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+
+COALESCED_METHODS = frozenset((
+    'users.get',
+    'groups.getById',
+    'groups.getMembers',
+    'groups.isMember',
+    'groups.getLongPollSettings',
+    'messages.getById',
+    'messages.getByConversationMessageId',
+    'messages.getConversationsById',
+    'messages.getConversationMembers',
+    'messages.getHistoryAttachments',
+    'photos.getById',
+    'docs.getById',
+    'video.get',
+    'wall.getById',
+    'wall.getComment',
+    'board.getComments',
+    'utils.resolveScreenName',
+    'utils.getServerTime',
+))
+
+
+class RequestCoalescer:
+    """Shares one HTTP request between identical read-only API calls that are in flight at the same time.
+
+    All callers receive the same response object, so it should not be modified in place.
+
+    Attributes
+    ----------
+    methods: FrozenSet[:class:`str`]
+        Read-only methods that are safe to coalesce
+    """
+
+    def __init__(self, methods=COALESCED_METHODS, *, loop):
+        self.methods = frozenset(methods)
+        self.loop = loop
+        self._in_flight = {}
+        self._hits = 0
+        self._misses = 0
+
+    def can_coalesce(self, method):
+        return method in self.methods
+
+    async def request(self, key, factory):
+        try:
+            task = self._in_flight[key]
+        except KeyError:
+            self._misses += 1
+            task = self._in_flight[key] = self.loop.create_task(factory())
+            task.add_done_callback(lambda t: self._in_flight.pop(key, None) if self._in_flight.get(key) is t else None)
+        else:
+            self._hits += 1
+        return await asyncio.shield(task)
+
+    @property
+    def stats(self):
+        """:class:`dict`: Number of coalesced calls (``hits``), calls that made a request (``misses``) and requests in flight"""
+        return {
+            'hits': self._hits,
+            'misses': self._misses,
+            'in_flight': len(self._in_flight)
+        }
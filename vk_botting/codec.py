@@ -0,0 +1,137 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import json
+
+
+class JSONCodec:
+    """JSON codec based on standard :mod:`json` module.
+
+    Subclass it and override :meth:`dumps` and :meth:`loads` to plug in another JSON library.
+    """
+    name = 'json'
+
+    def dumps(self, obj):
+        """Encodes object into compact JSON :class:`str`"""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+
+    def loads(self, data):
+        """Decodes JSON from :class:`str` or :class:`bytes`"""
+        return json.loads(data)
+
+    def __repr__(self):
+        return '<{0.__class__.__name__} name: {0.name}>'.format(self)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSON codec based on `orjson <https://github.com/ijl/orjson>`_"""
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj):
+        try:
+            return self._orjson.dumps(obj, option=self._option).decode('utf-8')
+        except TypeError:
+            # orjson does not support integers over 64 bits and some other types
+            return super().dumps(obj)
+
+    def loads(self, data):
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    """JSON codec based on `ujson <https://github.com/ultrajson/ultrajson>`_"""
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj):
+        try:
+            return self._ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+        except OverflowError:
+            # ujson does not support integers over 64 bits
+            return super().dumps(obj)
+
+    def loads(self, data):
+        return self._ujson.loads(data)
+
+
+_codecs = {
+    'json': JSONCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+}
+
+
+def detect_codec():
+    """Returns the fastest available codec: orjson, ujson or standard json, in that order"""
+    for cls in (OrjsonCodec, UjsonCodec):
+        try:
+            return cls()
+        except ImportError:
+            pass
+    return JSONCodec()
+
+
+def get_codec():
+    """Returns codec currently used by the library"""
+    return _current
+
+
+def set_codec(codec):
+    """Sets codec used by the library for all JSON encoding and decoding.
+
+    The codec is global for the process and is shared by all clients, so it should be set once before bots are created.
+    By default orjson or ujson is used if installed, standard json otherwise.
+
+    Parameters
+    ----------
+    codec: Union[:class:`str`, :class:`JSONCodec`]
+        Codec instance, or one of ``'json'``, ``'orjson'``, ``'ujson'``.
+
+    Raises
+    --------
+    ValueError
+        When unknown codec name is passed.
+    ImportError
+        When library of the codec is not installed.
+    """
+    global _current
+    if isinstance(codec, str):
+        try:
+            codec = _codecs[codec]()
+        except KeyError:
+            raise ValueError('Unknown JSON codec: {}'.format(codec)) from None
+    _current = codec
+    return codec
+
+
+_current = detect_codec()
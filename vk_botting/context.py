@@ -182,10 +182,10 @@ class Context(Messageable):
             self.invoked_subcommand = invoked_subcommand
             self.subcommand_passed = subcommand_passed
 
-    async def reply(self, message=None, *, attachment=None, sticker_id=None, keyboard=None):
+    async def reply(self, message=None, *, attachment=None, sticker_id=None, keyboard=None, random_id=None, idempotency_key=None):
         """|coro|
         Shorthand for :meth:`.Message.reply`"""
-        return await self.message.reply(message, attachment=attachment, sticker_id=sticker_id, keyboard=keyboard)
+        return await self.message.reply(message, attachment=attachment, sticker_id=sticker_id, keyboard=keyboard, random_id=random_id, idempotency_key=idempotency_key)
 
     async def get_user(self, fields=None, name_case=None):
         """|coro|
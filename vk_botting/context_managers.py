@@ -33,11 +33,71 @@ def _typing_done_callback(fut):
         pass
 
 
+class TypingScheduler:
+    """Keeps typing state in peers while any :meth:`.typing` block is active in them.
+
+    Overlapping blocks in one peer share a single task, so typing state is sent to every peer
+    at most once per ``interval``. The task is stopped when the last block exits or a message is sent to the peer.
+    """
+
+    def __init__(self, bot, *, interval=5.0):
+        self.bot = bot
+        self.interval = interval
+        self._refs = {}
+        self._tasks = {}
+        self._calls = 0
+
+    def _key(self, peer_id):
+        # Same peer can talk to several groups hosted by one bot
+        group = self.bot.group
+        return group.id if group is not None else None, peer_id
+
+    def acquire(self, peer_id):
+        key = self._key(peer_id)
+        self._refs[key] = self._refs.get(key, 0) + 1
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            task = self._tasks[key] = asyncio.ensure_future(self._typing(peer_id), loop=self.bot.loop)
+            task.add_done_callback(_typing_done_callback)
+
+    def release(self, peer_id):
+        key = self._key(peer_id)
+        refs = self._refs.get(key, 0) - 1
+        if refs > 0:
+            self._refs[key] = refs
+            return
+        self._refs.pop(key, None)
+        self._stop(key)
+
+    def message_sent(self, peer_id):
+        self._stop(self._key(peer_id))
+
+    def _stop(self, key):
+        task = self._tasks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    async def _typing(self, peer_id):
+        while True:
+            self._calls += 1
+            await self.bot.vk_request('messages.setActivity', group_id=self.bot.group.id, type='typing', peer_id=peer_id)
+            await asyncio.sleep(self.interval)
+
+    @property
+    def stats(self):
+        return {
+            'peers': sum(1 for task in self._tasks.values() if not task.done()),
+            'blocks': sum(self._refs.values()),
+            'calls': self._calls
+        }
+
+
 class Typing:
     def __init__(self, messageable):
         self.bot = messageable.bot
         self.loop = messageable.bot.loop
         self.messageable = messageable
+        self._peer_id = None
 
     async def send_typing(self, peer_id):
         await self.bot.vk_request('messages.setActivity', group_id=self.bot.group.id, type='typing', peer_id=peer_id)
@@ -47,10 +107,8 @@ class Typing:
             conversation = self._conversation
         except AttributeError:
             conversation = self._conversation = await self.messageable._get_conversation()
-
-        while True:
-            await self.send_typing(conversation)
-            await asyncio.sleep(5)
+        self.bot.typing_scheduler.acquire(conversation)
+        self._peer_id = conversation
 
     def __enter__(self):
         self.task = asyncio.ensure_future(self.do_typing(), loop=self.loop)
@@ -58,12 +116,17 @@ class Typing:
         return self
 
     def __exit__(self, exc_type, exc, tb):
-        self.task.cancel()
+        if self._peer_id is None:
+            self.task.cancel()
+        else:
+            self.bot.typing_scheduler.release(self._peer_id)
+            self._peer_id = None
 
     async def __aenter__(self):
         self._conversation = conversation = await self.messageable._get_conversation()
-        await self.send_typing(conversation)
-        return self.__enter__()
+        self.bot.typing_scheduler.acquire(conversation)
+        self._peer_id = conversation
+        return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        self.task.cancel()
+        self.__exit__(exc_type, exc, tb)
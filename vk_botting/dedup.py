@@ -0,0 +1,84 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import time
+from collections import deque
+
+
+class SeenEvents:
+    """Set of recently seen event ids with bounded memory.
+
+    Ids are kept in buckets each covering ``ttl / buckets`` seconds or ``maxsize / buckets`` ids.
+    Expired buckets are dropped as a whole, and the oldest ones are dropped early if more than ``maxsize`` ids are kept.
+
+    Parameters
+    ----------
+    ttl: :class:`float`
+        Number of seconds an id is remembered for. Defaults to 600
+    buckets: :class:`int`
+        Number of buckets the window is split into. Defaults to 10
+    maxsize: :class:`int`
+        Maximum number of ids kept. Defaults to 100000
+    """
+
+    def __init__(self, ttl=600.0, buckets=10, maxsize=100000):
+        self.ttl = float(ttl)
+        self.span = self.ttl / buckets
+        self.maxsize = maxsize
+        self._bucket_size = max(1, maxsize // buckets)
+        self._buckets = deque()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def _rotate(self, now):
+        if not self._buckets or now - self._buckets[-1][0] >= self.span or len(self._buckets[-1][1]) >= self._bucket_size:
+            self._buckets.append((now, set()))
+        while self._buckets[0][0] <= now - self.ttl or (self._size > self.maxsize and len(self._buckets) > 1):
+            self._size -= len(self._buckets.popleft()[1])
+
+    def seen(self, event_id):
+        """Returns ``True`` if the id was seen within the window, otherwise remembers it and returns ``False``"""
+        now = time.monotonic()
+        self._rotate(now)
+        for _, ids in self._buckets:
+            if event_id in ids:
+                self._hits += 1
+                return True
+        self._buckets[-1][1].add(event_id)
+        self._size += 1
+        self._misses += 1
+        return False
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def stats(self):
+        return {
+            'duplicates': self._hits,
+            'unique': self._misses,
+            'size': self._size
+        }
@@ -55,6 +55,24 @@ class VKApiError(VKException):
     pass
 
 
+class CircuitBreakerOpen(VKApiError):
+    """Exception raised when request is not made because the endpoint failed too many times in a row.
+
+    This inherits from :exc:`VKApiError`
+
+    Attributes
+    -----------
+    endpoint: :class:`str`
+        Host requests to which are stopped
+    retry_after: :class:`float`
+        Seconds left until the endpoint is probed again
+    """
+    def __init__(self, endpoint, retry_after):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__('Requests to {} are stopped after repeated failures. Try again in {:.2f}s'.format(endpoint, retry_after))
+
+
 class CommandError(VKException):
     r"""The base exception type for all command related errors.
 
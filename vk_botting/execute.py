@@ -0,0 +1,122 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from vk_botting.utils import to_json
+
+_UNBATCHABLE = frozenset((
+    'execute',
+))
+
+
+class ExecuteBatcher:
+    """Merges concurrent API calls into VK ``execute`` requests.
+
+    Calls issued within ``delay`` seconds of each other (or up to ``size`` calls, 25 at most)
+    with the same access token are sent as one ``execute`` call, and every result or error
+    is routed back to the coroutine that issued the call.
+
+    Normally should not be created manually, pass ``batch_requests=True`` to :class:`.Bot` instead.
+
+    Attributes
+    ----------
+    delay: :class:`float`
+        Seconds to wait for more calls before sending a batch
+    size: :class:`int`
+        Maximum number of calls in one batch
+    """
+
+    def __init__(self, client, *, delay=0.05, size=25):
+        self.client = client
+        self.delay = delay
+        self.size = max(1, min(int(size), 25))
+        self._pending = {}
+        self._handles = {}
+
+    @property
+    def loop(self):
+        return self.client.loop
+
+    def can_batch(self, method):
+        return method not in _UNBATCHABLE
+
+    def request(self, method, post, params, priority):
+        params = dict(params)
+        key = (params.pop('access_token', None), params.pop('v', None), params.pop('lang', None))
+        future = self.loop.create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((method, post, params, future, priority))
+        if len(batch) >= self.size:
+            self._flush(key)
+        elif key not in self._handles:
+            self._handles[key] = self.loop.call_later(self.delay, self._flush, key)
+        return future
+
+    def _flush(self, key):
+        handle = self._handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(key, None)
+        if batch:
+            self.loop.create_task(self._send(key, batch))
+
+    async def _send(self, key, batch):
+        token, v, lang = key
+        batch = [call for call in batch if not call[3].cancelled()]
+        if not batch:
+            return
+        priority = min(call[4] for call in batch)
+        try:
+            if len(batch) == 1:
+                method, post, params, future, _ = batch[0]
+                res = await self.client._send_vk_request(method, post, priority, access_token=token, v=v, lang=lang, **params)
+                if not future.done():
+                    future.set_result(res)
+                return
+            code = 'return [{}];'.format(','.join('API.{}({})'.format(call[0], to_json(call[2])) for call in batch))
+            res = await self.client._send_vk_request('execute', True, priority, access_token=token, v=v, lang=lang, code=code)
+        except Exception as exc:
+            for call in batch:
+                future = call[3]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for future, result in zip((call[3] for call in batch), _split_execute_response(res, len(batch))):
+            if not future.done():
+                future.set_result(result)
+
+
+def _split_execute_response(res, count):
+    if 'error' in res:
+        return [{'error': res['error']}] * count
+    responses = res.get('response') or []
+    errors = list(res.get('execute_errors', []))
+    results = []
+    for i in range(count):
+        response = responses[i] if i < len(responses) else False
+        if response is False and errors:
+            results.append({'error': errors.pop(0)})
+        else:
+            results.append({'response': response})
+    return results
@@ -0,0 +1,200 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from collections import deque
+
+from vk_botting.hosting import contextvars
+
+OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_events')
+
+
+class _Job:
+    __slots__ = ('peer_id', 'event_name', 'start', 'drop', 'context')
+
+    def __init__(self, peer_id, event_name, start, drop):
+        self.peer_id = peer_id
+        self.event_name = event_name
+        self.start = start
+        self.drop = drop
+        # Queued handler is started from a callback of another one, so it has to get back the context it was submitted in
+        self.context = contextvars.copy_context() if contextvars is not None else None
+
+    def dropped(self):
+        if self.drop is not None:
+            self.drop()
+
+
+class Governor:
+    """Limits number of event handlers running at the same time.
+
+    Handlers over the limits wait in a bounded FIFO queue. When the queue is full, ``overflow`` policy decides what happens:
+
+    - ``'block'``: new handlers are still queued, but receiving of updates is paused until the queue has room again
+    - ``'drop_oldest'``: the oldest queued handler is dropped
+    - ``'drop_events'``: a handler of one of ``shed_events`` is dropped, the new one if possible, otherwise the oldest queued one.
+      If there are none, the oldest queued handler is dropped
+
+    Normally should not be created manually, pass ``max_concurrency`` or ``max_peer_concurrency`` to :class:`.Bot` instead.
+
+    Attributes
+    ----------
+    max_concurrency: :class:`int`
+        Maximum number of handlers running at the same time, ``None`` for no limit
+    max_peer_concurrency: :class:`int`
+        Maximum number of handlers of events from one peer running at the same time, ``None`` for no limit
+    max_queue: :class:`int`
+        Maximum number of handlers waiting to be started
+    overflow: :class:`str`
+        Policy applied when the queue is full
+    shed_events: Set[:class:`str`]
+        Names of events that may be dropped with ``'drop_events'`` policy, e.g. ``'on_message_typing_state'``
+    """
+
+    def __init__(self, *, loop, max_concurrency=None, max_peer_concurrency=None, max_queue=1000, overflow='drop_oldest', shed_events=()):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Unknown overflow policy {!r}, expected one of {}'.format(overflow, ', '.join(OVERFLOW_POLICIES)))
+        self.loop = loop
+        self.max_concurrency = max_concurrency
+        self.max_peer_concurrency = max_peer_concurrency
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self.shed_events = frozenset(shed_events)
+        self._queue = deque()
+        self._running = 0
+        self._peers = {}
+        self._room = None
+        self._started = 0
+        self._dropped_oldest = 0
+        self._dropped_events = 0
+        self._blocked = 0
+        self._peak = 0
+
+    def _can_start(self, peer_id):
+        if self.max_concurrency is not None and self._running >= self.max_concurrency:
+            return False
+        if peer_id is not None and self.max_peer_concurrency is not None:
+            return self._peers.get(peer_id, 0) < self.max_peer_concurrency
+        return True
+
+    def _start(self, job):
+        self._running += 1
+        self._started += 1
+        if job.peer_id is not None:
+            self._peers[job.peer_id] = self._peers.get(job.peer_id, 0) + 1
+        task = job.context.run(job.start) if job.context is not None else job.start()
+        task.add_done_callback(lambda _: self._done(job.peer_id))
+        return task
+
+    def _done(self, peer_id):
+        self._running -= 1
+        if peer_id is not None:
+            count = self._peers[peer_id] - 1
+            if count:
+                self._peers[peer_id] = count
+            else:
+                del self._peers[peer_id]
+        self._start_queued()
+
+    def _start_queued(self):
+        if self._queue and (self.max_concurrency is None or self._running < self.max_concurrency):
+            for job in list(self._queue):
+                if self.max_concurrency is not None and self._running >= self.max_concurrency:
+                    break
+                if self._can_start(job.peer_id):
+                    self._queue.remove(job)
+                    self._start(job)
+        if self._room is not None and len(self._queue) < self.max_queue:
+            self._room.set_result(None)
+            self._room = None
+
+    def _shed(self, job):
+        if self.overflow == 'drop_events':
+            if job.event_name in self.shed_events:
+                self._dropped_events += 1
+                job.dropped()
+                return False
+            for queued in self._queue:
+                if queued.event_name in self.shed_events:
+                    self._queue.remove(queued)
+                    self._dropped_events += 1
+                    queued.dropped()
+                    return True
+        self._queue.popleft().dropped()
+        self._dropped_oldest += 1
+        return True
+
+    def submit(self, peer_id, event_name, start, drop=None):
+        """Starts the handler or queues it.
+
+        Parameters
+        ----------
+        peer_id: :class:`int`
+            Id of the peer the event came from, or ``None``
+        event_name: :class:`str`
+            Name of the handled event
+        start: Callable[[], :class:`asyncio.Task`]
+            Function that starts the handler
+        drop: Optional[Callable[[], None]]
+            Function called if the handler is dropped without being started
+
+        Returns
+        -------
+        Optional[:class:`asyncio.Task`]
+            Task of the handler if it was started right away
+        """
+        job = _Job(peer_id, event_name, start, drop)
+        if self._can_start(peer_id):
+            return self._start(job)
+        if len(self._queue) >= self.max_queue and self.overflow != 'block':
+            if not self._shed(job):
+                return None
+        self._queue.append(job)
+        self._peak = max(self._peak, len(self._queue))
+        return None
+
+    async def wait(self):
+        """|coro|
+
+        Waits until the queue has room if ``overflow`` is ``'block'``, returns right away otherwise.
+        """
+        if self.overflow != 'block' or len(self._queue) < self.max_queue:
+            return
+        self._blocked += 1
+        if self._room is None:
+            self._room = self.loop.create_future()
+        await asyncio.shield(self._room)
+
+    @property
+    def stats(self):
+        return {
+            'running': self._running,
+            'queued': len(self._queue),
+            'peak_queued': self._peak,
+            'started': self._started,
+            'dropped_oldest': self._dropped_oldest,
+            'dropped_events': self._dropped_events,
+            'blocked': self._blocked
+        }
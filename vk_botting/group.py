@@ -45,6 +45,8 @@ class Group:
         Has group photo urls with different sizes
     """
 
+    __slots__ = ('original_data', 'id', 'name', 'screen_name', 'is_closed', 'type', 'photo')
+
     def __init__(self, data):
         self.original_data = deepcopy(data)
         self._unpack(data)
@@ -67,6 +69,7 @@ class Group:
 
 
 class Comments:
+    __slots__ = ('count', 'can_post', 'groups_can_post', 'can_close', 'can_open')
 
     def __init__(self, data):
         self._unpack(data)
@@ -80,6 +83,7 @@ class Comments:
 
 
 class Likes:
+    __slots__ = ('count', 'user_likes', 'can_like', 'can_publish')
 
     def __init__(self, data):
         self._unpack(data)
@@ -92,6 +96,7 @@ class Likes:
 
 
 class Reposts:
+    __slots__ = ('count', 'user_reposted')
 
     def __init__(self, data):
         self._unpack(data)
@@ -102,6 +107,7 @@ class Reposts:
 
 
 class Views:
+    __slots__ = ('count',)
 
     def __init__(self, data):
         self._unpack(data)
@@ -111,6 +117,7 @@ class Views:
 
 
 class Geo:
+    __slots__ = ('type', 'coordinates', 'place')
 
     def __init__(self, data):
         self._unpack(data)
@@ -122,6 +129,7 @@ class Geo:
 
 
 class Thread:
+    __slots__ = ('count', 'items', 'can_post', 'show_reply_button', 'groups_can_post')
 
     def __init__(self, data):
         self._unpack(data)
@@ -135,6 +143,10 @@ class Thread:
 
 
 class WallComment:
+    __slots__ = (
+        'id', 'from_id', 'date', 'text', 'reply_to_user', 'reply_to_comment', 'attachments', 'parents_stack', 'thread', 'post_id',
+        'post_owner_id'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -154,6 +166,7 @@ class WallComment:
 
 
 class DeletedWallComment:
+    __slots__ = ('owner_id', 'id', 'deleter_id', 'post_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -166,6 +179,10 @@ class DeletedWallComment:
 
 
 class MarketComment:
+    __slots__ = (
+        'id', 'from_id', 'date', 'text', 'reply_to_user', 'reply_to_comment', 'attachments', 'parents_stack', 'thread', 'market_owner_id',
+        'item_id'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -185,6 +202,7 @@ class MarketComment:
 
 
 class DeletedMarketComment:
+    __slots__ = ('owner_id', 'id', 'user_id', 'deleter_id', 'item_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -198,6 +216,10 @@ class DeletedMarketComment:
 
 
 class VideoComment:
+    __slots__ = (
+        'id', 'from_id', 'date', 'text', 'reply_to_user', 'reply_to_comment', 'attachments', 'parents_stack', 'thread', 'video_id',
+        'video_owner_id'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -217,6 +239,7 @@ class VideoComment:
 
 
 class DeletedVideoComment:
+    __slots__ = ('owner_id', 'id', 'user_id', 'deleter_id', 'video_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -230,6 +253,10 @@ class DeletedVideoComment:
 
 
 class PhotoComment:
+    __slots__ = (
+        'id', 'from_id', 'date', 'text', 'reply_to_user', 'reply_to_comment', 'attachments', 'parents_stack', 'thread', 'photo_id',
+        'photo_owner_id'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -249,6 +276,7 @@ class PhotoComment:
 
 
 class DeletedPhotoComment:
+    __slots__ = ('owner_id', 'id', 'user_id', 'deleter_id', 'photo_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -262,6 +290,11 @@ class DeletedPhotoComment:
 
 
 class Post:
+    __slots__ = (
+        'id', 'from_id', 'owner_id', 'date', 'marked_as_ads', 'post_type', 'text', 'can_pin', 'can_edit', 'created_by', 'can_delete',
+        'comments', 'is_favorite', 'likes', 'reposts', 'views', 'attachments', 'geo', 'signer_id', 'copy_history', 'is_pinned',
+        'postponed_id'
+    )
 
     def __init__(self, data):
         self._unpack(data)
@@ -292,6 +325,7 @@ class Post:
 
 
 class BoardComment:
+    __slots__ = ('id', 'from_id', 'date', 'text', 'attachments', 'likes', 'topic_id', 'topic_owner_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -308,6 +342,7 @@ class BoardComment:
 
 
 class DeletedBoardComment:
+    __slots__ = ('topic_owner_id', 'topic_id', 'id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -319,6 +354,7 @@ class DeletedBoardComment:
 
 
 class PollVote:
+    __slots__ = ('owner_id', 'poll_id', 'option_id', 'user_id')
 
     def __init__(self, data):
         self._unpack(data)
@@ -331,6 +367,7 @@ class PollVote:
 
 
 class OfficersEdit:
+    __slots__ = ('admin_id', 'user_id', 'level_old', 'level_new')
 
     def __init__(self, data):
         self._unpack(data)
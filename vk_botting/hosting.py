@@ -0,0 +1,92 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+try:
+    import contextvars
+except ImportError:
+    contextvars = None
+
+
+class HostedGroup:
+    """One of the groups hosted by :meth:`.Bot.run_groups`.
+
+    Attributes
+    ----------
+    token: :class:`str`
+        Group token
+    group: :class:`.Group`
+        Group the token belongs to. ``None`` until the bot is connected
+    """
+
+    def __init__(self, token):
+        self.token = token
+        self.group = None
+        self.key = None
+        self.server = None
+
+    @property
+    def id(self):
+        return self.group.id if self.group is not None else None
+
+    def __repr__(self):
+        return '<HostedGroup id={}>'.format(self.id)
+
+
+_current_group = contextvars.ContextVar('vk_botting_hosted_group', default=None) if contextvars is not None else None
+
+
+def get_current_group():
+    """Returns :class:`HostedGroup` current event is handled for, or ``None`` if groups are not hosted"""
+    if _current_group is None:
+        return None
+    return _current_group.get()
+
+
+def set_current_group(hosted):
+    """Makes ``hosted`` the current group for the running task and tasks it creates"""
+    _current_group.set(hosted)
+
+
+class _HostedAttribute:
+    # Attribute of the client that has a separate value for every hosted group
+
+    def __init__(self, name):
+        self.name = name
+        self.attr = '_' + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        hosted = get_current_group()
+        if hosted is not None:
+            return getattr(hosted, self.name)
+        return instance.__dict__.get(self.attr)
+
+    def __set__(self, instance, value):
+        hosted = get_current_group()
+        if hosted is not None:
+            setattr(hosted, self.name, value)
+        else:
+            instance.__dict__[self.attr] = value
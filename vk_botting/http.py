@@ -0,0 +1,146 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import aiohttp
+
+
+class ConnectionConfig:
+    """Settings of one HTTP connection pool.
+
+    Parameters
+    ----------
+    limit: :class:`int`
+        Maximum number of simultaneous connections. 0 means no limit
+    limit_per_host: :class:`int`
+        Maximum number of simultaneous connections to one host. 0 means no limit
+    keepalive_timeout: :class:`float`
+        Seconds an idle connection is kept open for reuse
+    dns_cache_ttl: :class:`int`
+        Seconds resolved addresses are cached for. ``None`` caches them forever
+    timeout: :class:`float`
+        Total timeout of one request in seconds
+    connect_timeout: :class:`float`
+        Timeout of establishing a connection in seconds
+    """
+
+    def __init__(self, *, limit=100, limit_per_host=0, keepalive_timeout=30.0, dns_cache_ttl=300, timeout=100.0, connect_timeout=10.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+
+    def create_session(self, headers=None, trace_configs=None):
+        connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host, keepalive_timeout=self.keepalive_timeout,
+                                         ttl_dns_cache=self.dns_cache_ttl, use_dns_cache=True)
+        timeout = aiohttp.ClientTimeout(total=self.timeout, connect=self.connect_timeout)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers, trace_configs=trace_configs)
+
+    def __repr__(self):
+        return '<ConnectionConfig limit: {0.limit} limit_per_host: {0.limit_per_host} keepalive_timeout: {0.keepalive_timeout}>'.format(self)
+
+
+class _PoolMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.created = 0
+        self.reused = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+        self.trace_config.on_connection_create_end.append(self._on_connection_create_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reuseconn)
+
+    async def _on_request_start(self, session, ctx, params):
+        self.requests += 1
+        self.in_flight += 1
+
+    async def _on_request_end(self, session, ctx, params):
+        self.in_flight -= 1
+
+    async def _on_request_exception(self, session, ctx, params):
+        self.in_flight -= 1
+        self.failed += 1
+
+    async def _on_connection_create_end(self, session, ctx, params):
+        self.created += 1
+
+    async def _on_connection_reuseconn(self, session, ctx, params):
+        self.reused += 1
+
+    @property
+    def stats(self):
+        connections = self.created + self.reused
+        return {
+            'requests': self.requests,
+            'failed': self.failed,
+            'in_flight': self.in_flight,
+            'connections_created': self.created,
+            'connections_reused': self.reused,
+            'reuse_rate': self.reused / connections if connections else 0.0
+        }
+
+
+class HTTPSessions:
+    """Separate HTTP sessions for VK API calls, long-poll requests and file uploads.
+
+    A slow long-poll or a hung upload can then never occupy connections needed by API calls.
+
+    Attributes
+    ----------
+    api: :class:`aiohttp.ClientSession`
+        Session used for calls to api.vk.com
+    longpoll: :class:`aiohttp.ClientSession`
+        Session used for long-poll requests
+    upload: :class:`aiohttp.ClientSession`
+        Session used for uploads and downloads of files
+    """
+
+    def __init__(self, *, session=None, headers=None, api=None, longpoll=None, upload=None):
+        self._metrics = {}
+        if session is not None:
+            self.api = self.longpoll = self.upload = session
+            return
+        self.api = self._create('api', api or ConnectionConfig(), headers)
+        self.longpoll = self._create('longpoll', longpoll or ConnectionConfig(limit=10), headers)
+        self.upload = self._create('upload', upload or ConnectionConfig(limit=20, keepalive_timeout=15.0), headers)
+
+    def _create(self, name, config, headers):
+        metrics = self._metrics[name] = _PoolMetrics()
+        return config.create_session(headers=headers, trace_configs=[metrics.trace_config])
+
+    async def close(self):
+        for session in {self.api, self.longpoll, self.upload}:
+            if not session.closed:
+                await session.close()
+
+    @property
+    def stats(self):
+        """:class:`dict`: Request counts and connection reuse statistics for every pool"""
+        return {name: metrics.stats for name, metrics in self._metrics.items()}
@@ -0,0 +1,105 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import sqlite3
+import time
+
+from vk_botting.utils import to_json, from_json
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sends (
+    key TEXT PRIMARY KEY,
+    random_id INTEGER NOT NULL,
+    message TEXT,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sends_created ON sends (created);
+"""
+
+
+class SendJournal:
+    """Local journal of sent messages keyed by caller-provided idempotency keys.
+
+    Message sent with an ``idempotency_key`` that is already in the journal is not sent again:
+    if the previous send was completed, the saved message is returned, otherwise
+    the message is sent with the same ``random_id``, so VK drops the duplicate.
+
+    Parameters
+    ----------
+    path: :class:`str`
+        Path to the sqlite file to keep journal in. Defaults to ``':memory:'``, which keeps it only until the bot is stopped
+    ttl: :class:`float`
+        Number of seconds to keep entries for. Defaults to 86400
+    """
+
+    def __init__(self, path=':memory:', *, ttl=86400.0):
+        self.path = path
+        self.ttl = ttl
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+        self._pruned = 0
+        self.prune()
+
+    def get(self, key):
+        """Returns tuple of ``random_id`` and saved message :class:`dict` (``None`` if send was not completed) for the key, or ``None`` if key is not in the journal"""
+        row = self._db.execute('SELECT random_id, message, created FROM sends WHERE key = ?', (key,)).fetchone()
+        if row is None or row[2] < time.time() - self.ttl:
+            return None
+        return row[0], from_json(row[1]) if row[1] is not None else None
+
+    def reserve(self, key, random_id):
+        """Saves ``random_id`` to be used for all sends with the key"""
+        now = time.time()
+        if now - self._pruned > 60:
+            self.prune()
+        with self._db:
+            self._db.execute('INSERT OR REPLACE INTO sends (key, random_id, created) VALUES (?, ?, ?)', (key, random_id, now))
+        return random_id
+
+    def complete(self, key, message):
+        """Saves message :class:`dict` sent with the key"""
+        with self._db:
+            self._db.execute('UPDATE sends SET message = ? WHERE key = ?', (to_json(message), key))
+
+    def forget(self, key):
+        """Removes the key from the journal, so next send with it is a new message"""
+        with self._db:
+            self._db.execute('DELETE FROM sends WHERE key = ?', (key,))
+
+    def prune(self):
+        """Removes expired entries"""
+        self._pruned = time.time()
+        with self._db:
+            self._db.execute('DELETE FROM sends WHERE created < ?', (self._pruned - self.ttl,))
+
+    def close(self):
+        """Closes the journal file"""
+        self._db.close()
+
+    def __len__(self):
+        return self._db.execute('SELECT COUNT(*) FROM sends').fetchone()[0]
+
+    def __contains__(self, key):
+        return self.get(key) is not None
@@ -0,0 +1,79 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+
+
+class BatchLoader:
+    """Collects keys requested during one event loop iteration and loads them with as few calls as possible.
+
+    Keys are split into chunks of ``max_batch_size`` that are loaded concurrently.
+
+    Parameters
+    ----------
+    batch_load: :ref:`coroutine <coroutine>`
+        Coroutine function that takes a list of keys and returns :class:`dict` mapping keys to values.
+        Keys missing from the result resolve to ``None``
+    max_batch_size: :class:`int`
+        Maximum number of keys passed to one ``batch_load`` call
+    """
+
+    def __init__(self, batch_load, *, loop, max_batch_size=1000):
+        self.batch_load = batch_load
+        self.loop = loop
+        self.max_batch_size = max_batch_size
+        self._queue = {}
+        self._scheduled = False
+
+    def load(self, key):
+        future = self._queue.get(key)
+        if future is None:
+            future = self._queue[key] = self.loop.create_future()
+            if not self._scheduled:
+                self._scheduled = True
+                self.loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys):
+        return await asyncio.gather(*[self.load(key) for key in keys])
+
+    def _dispatch(self):
+        self._scheduled = False
+        queue, self._queue = self._queue, {}
+        keys = list(queue)
+        for i in range(0, len(keys), self.max_batch_size):
+            self.loop.create_task(self._load_chunk(keys[i:i + self.max_batch_size], queue))
+
+    async def _load_chunk(self, keys, futures):
+        try:
+            values = await self.batch_load(keys)
+        except Exception as exc:
+            for key in keys:
+                if not futures[key].done():
+                    futures[key].set_exception(exc)
+            return
+        for key in keys:
+            if not futures[key].done():
+                futures[key].set_result(values.get(key))
@@ -0,0 +1,100 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from collections import deque
+
+
+class _Mailbox:
+    __slots__ = ('jobs', 'worker')
+
+    def __init__(self):
+        self.jobs = deque()
+        self.worker = None
+
+
+class Mailboxes:
+    """Runs event handlers of every peer one at a time in the order events were received.
+
+    Handlers of different peers run in parallel. Mailbox of a peer exists only while it has handlers
+    to run, so memory does not grow with number of peers.
+
+    Normally should not be created manually, pass ``serialize_peers=True`` to :class:`.Bot` instead.
+
+    Attributes
+    ----------
+    max_size: :class:`int`
+        Maximum number of handlers waiting in one mailbox. The oldest waiting handler is dropped when it is exceeded
+    """
+
+    def __init__(self, *, loop, max_size=100):
+        self.loop = loop
+        self.max_size = max_size
+        self._boxes = {}
+        self._processed = 0
+        self._dropped = 0
+
+    def submit(self, peer_id, job):
+        """Queues a handler of event from the peer.
+
+        Parameters
+        ----------
+        peer_id: :class:`int`
+            Id of the peer the event came from
+        job: Callable[[], Awaitable]
+            Function that runs the handler
+        """
+        box = self._boxes.get(peer_id)
+        if box is None:
+            box = self._boxes[peer_id] = _Mailbox()
+        if len(box.jobs) >= self.max_size:
+            box.jobs.popleft()
+            self._dropped += 1
+        box.jobs.append(job)
+        if box.worker is None:
+            box.worker = self.loop.create_task(self._drain(peer_id, box))
+        return box.worker
+
+    async def _drain(self, peer_id, box):
+        try:
+            while box.jobs:
+                job = box.jobs.popleft()
+                await job()
+                self._processed += 1
+        finally:
+            box.worker = None
+            if self._boxes.get(peer_id) is box:
+                del self._boxes[peer_id]
+
+    def __len__(self):
+        return len(self._boxes)
+
+    @property
+    def stats(self):
+        return {
+            'mailboxes': len(self._boxes),
+            'queued': sum(len(box.jobs) for box in self._boxes.values()),
+            'processed': self._processed,
+            'dropped': self._dropped
+        }
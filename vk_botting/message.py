@@ -23,14 +23,62 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from copy import deepcopy
 from datetime import datetime
 from random import randint
 
 from vk_botting.abstract import Messageable
+from vk_botting.attachments import get_attachment
 from vk_botting.exceptions import VKApiError
 
 
+_MISSING = object()
+
+
+class _LazyField:
+    # Reads the field from raw message data on first access and caches it in the instance slot
+
+    def __init__(self, key, convert=None, default=None):
+        self.key = key
+        self.convert = convert
+        self.default = default
+        self.slot = '_' + key
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = instance.original_data.get(self.key, self.default)
+        if self.convert is not None:
+            value = self.convert(instance, value)
+        setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
+def _to_datetime(msg, value):
+    return datetime.fromtimestamp(value)
+
+
+def _to_action(msg, value):
+    return MessageAction(value) if value else None
+
+
+def _to_attachments(msg, value):
+    return [get_attachment(attachment) for attachment in value] if value else value
+
+
+def _to_messages(msg, value):
+    return [msg._build(message) for message in value] if value else value
+
+
+def _to_message(msg, value):
+    return msg._build(value) if value else value
+
+
 class MessageEvent:
     """Represents a message event (https://vk.com/dev/bots_docs_5).
 
@@ -165,6 +213,8 @@ class MessageEvent:
 
 
 class MessageAction:
+    __slots__ = ('type', 'member_id', 'text', 'email', 'photo')
+
     def __init__(self, data):
         self._unpack(data)
 
@@ -208,35 +258,47 @@ class Message(Messageable):
         Message that this message replied to
     action: Union[:class:`.MessageAction`, :class:`NoneType`]
         Action payload
+    original_data: :class:`dict`
+        Raw message object the message was built from. It is not copied, so it should not be modified
+
+    Attributes are read from raw message object on first access, so only the ones used are ever parsed.
     """
 
+    __slots__ = (
+        'original_data', '_id', '_date', '_update_time', '_peer_id', '_from_id', '_text', '_random_id', '_ref', '_ref_source', '_attachments',
+        '_important', '_geo', '_payload', '_keyboard', '_fwd_messages', '_reply_message', '_action', '_conversation_message_id'
+    )
+
+    id = _LazyField('id')
+    date = _LazyField('date', _to_datetime, 86400)
+    update_time = _LazyField('update_time', _to_datetime, 86400)
+    peer_id = _LazyField('peer_id')
+    from_id = _LazyField('from_id')
+    text = _LazyField('text')
+    random_id = _LazyField('random_id')
+    ref = _LazyField('ref')
+    ref_source = _LazyField('ref_source')
+    attachments = _LazyField('attachments', _to_attachments)
+    important = _LazyField('important')
+    geo = _LazyField('geo')
+    payload = _LazyField('payload')
+    keyboard = _LazyField('keyboard')
+    fwd_messages = _LazyField('fwd_messages', _to_messages)
+    reply_message = _LazyField('reply_message', _to_message)
+    action = _LazyField('action', _to_action)
+    conversation_message_id = _LazyField('conversation_message_id')
+
     async def _get_conversation(self):
         return self.peer_id
 
     def __init__(self, data):
-        self.original_data = deepcopy(data)
-        self._unpack(data)
+        self.original_data = data
 
-    def _unpack(self, data):
-        self.id = data.get('id')
-        self.date = datetime.fromtimestamp(data.get('date', 86400))
-        self.update_time = datetime.fromtimestamp(data.get('update_time', 86400))
-        self.peer_id = data.get('peer_id')
-        self.from_id = data.get('from_id')
-        self.text = data.get('text')
-        self.random_id = data.get('random_id')
-        self.ref = data.get('ref')
-        self.ref_source = data.get('ref_source')
-        self.attachments = data.get('attachments')
-        self.important = data.get('important')
-        self.geo = data.get('geo')
-        self.payload = data.get('payload')
-        self.keyboard = data.get('keyboard')
-        self.fwd_messages = data.get('fwd_messages')
-        self.reply_message = data.get('reply_message')
-        action = data.get('action')
-        self.action = MessageAction(action) if action else None
-        self.conversation_message_id = data.get('conversation_message_id')
+    def _build(self, data):
+        bot = getattr(self, 'bot', None)
+        if bot is not None:
+            return bot.build_msg(data)
+        return Message(data)
 
     async def edit(self, message=None, *, attachment=None, keep_forward_messages=1, keep_snippets=1):
         """|coro|
@@ -327,6 +389,11 @@ class Message(Messageable):
             Sticker_id to be sent.
         keyboard: :class:`.Keyboard`
             The keyboard to send along message.
+        random_id: :class:`int`
+            Unique id of the message used by VK to drop duplicates. Generated once per call if not passed.
+        idempotency_key: :class:`str`
+            Key to save the message in :attr:`.Bot.send_journal` under. Message sent with a key that is already
+            in the journal is not sent again, the saved message is returned instead.
 
         Raises
         --------
@@ -373,6 +440,7 @@ class Message(Messageable):
 
 
 class UserMessage(Messageable):
+    __slots__ = ('id', 'date', 'flags', 'peer_id', 'from_id', 'text', 'attachments', 'important', 'payload', 'keyboard')
 
     async def _get_conversation(self):
         return self.peer_id
@@ -0,0 +1,132 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import time
+from collections import deque
+
+
+class _PeerQueue:
+    __slots__ = ('jobs', 'sent', 'worker')
+
+    def __init__(self, rate):
+        self.jobs = deque()
+        self.sent = deque(maxlen=rate)
+        self.worker = None
+
+
+class Outbox:
+    """Dispatcher of outgoing messages that keeps FIFO order for every peer.
+
+    Messages to different peers are sent in parallel, messages to one peer are sent one by one
+    and no faster than ``rate`` messages per ``per`` seconds to stay under flood control.
+
+    Normally should not be created manually, pass ``ordered_sends=True`` to :class:`.Bot` instead.
+
+    Attributes
+    ----------
+    rate: :class:`int`
+        Number of messages allowed to one peer per ``per`` seconds
+    per: :class:`float`
+        Length of the rate window in seconds
+    """
+
+    def __init__(self, *, loop, rate=3, per=1.0):
+        self.loop = loop
+        self.rate = int(rate)
+        self.per = float(per)
+        self._queues = {}
+
+    def submit(self, peer_id, factory):
+        """Queues a send for the peer.
+
+        Parameters
+        ----------
+        peer_id: :class:`int`
+            Id of the destination
+        factory: Callable[[], Awaitable]
+            Function that starts the send and returns an awaitable
+
+        Returns
+        -------
+        :class:`asyncio.Future`
+            Future that resolves to result of the send
+        """
+        queue = self._queues.get(peer_id)
+        if queue is None:
+            queue = self._queues[peer_id] = _PeerQueue(self.rate)
+        future = self.loop.create_future()
+        queue.jobs.append((factory, future))
+        if queue.worker is None:
+            queue.worker = self.loop.create_task(self._drain(peer_id, queue))
+        return future
+
+    async def _shape(self, queue):
+        if len(queue.sent) == self.rate:
+            delay = queue.sent[0] + self.per - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        queue.sent.append(time.monotonic())
+
+    async def _drain(self, peer_id, queue):
+        try:
+            while queue.jobs:
+                factory, future = queue.jobs.popleft()
+                if future.done():
+                    continue
+                await self._shape(queue)
+                try:
+                    result = await factory()
+                except Exception as exc:
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            queue.worker = None
+            self.loop.call_later(self.per, self._collect, peer_id, queue)
+
+    def _collect(self, peer_id, queue):
+        if queue.worker is None and not queue.jobs and self._queues.get(peer_id) is queue:
+            del self._queues[peer_id]
+
+    def queue_depth(self, peer_id):
+        """Returns number of messages waiting to be sent to the peer"""
+        queue = self._queues.get(peer_id)
+        if queue is None:
+            return 0
+        return len(queue.jobs) + (queue.worker is not None)
+
+    @property
+    def stats(self):
+        """:class:`dict`: Number of peers with messages in flight, total queued messages and queue depth of every such peer"""
+        depths = {peer_id: self.queue_depth(peer_id) for peer_id in self._queues}
+        depths = {peer_id: depth for peer_id, depth in depths.items() if depth}
+        return {
+            'peers': len(depths),
+            'queued': sum(depths.values()),
+            'depths': depths
+        }
@@ -0,0 +1,207 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import heapq
+import time
+from collections import deque
+from enum import IntEnum
+from itertools import count
+
+
+class Priority(IntEnum):
+    """Priority class of an API call. Calls with lower value are sent first when calls have to wait for rate limit"""
+    INTERACTIVE = 0     #: Replies to users, e.g. messages.send and messages.sendMessageEventAnswer
+    DEFAULT = 1         #: Calls without any specific priority
+    BULK = 2            #: Bulk work like broadcasts or member list sweeps
+    BACKGROUND = 3      #: Calls nobody waits for, e.g. messages.setActivity
+
+
+METHOD_PRIORITIES = {
+    'messages.send': Priority.INTERACTIVE,
+    'messages.sendMessageEventAnswer': Priority.INTERACTIVE,
+    'messages.edit': Priority.INTERACTIVE,
+    'messages.delete': Priority.INTERACTIVE,
+    'groups.getMembers': Priority.BULK,
+    'messages.getConversations': Priority.BULK,
+    'messages.getHistory': Priority.BULK,
+    'messages.setActivity': Priority.BACKGROUND,
+    'groups.getLongPollSettings': Priority.BACKGROUND,
+}
+
+
+def get_priority(method, priority=None):
+    if priority is not None:
+        return Priority(priority)
+    return METHOD_PRIORITIES.get(method, Priority.DEFAULT)
+
+
+class TokenBucket:
+    """Paces API calls made with one access token.
+
+    Keeps times of the last ``rate`` calls, so no ``per`` seconds long window ever has more than ``rate`` calls,
+    even right after the bot was idle. Once a call can be made, waiting calls are served by :class:`Priority`, then in FIFO order.
+
+    Attributes
+    ----------
+    rate: :class:`int`
+        Number of calls allowed per ``per`` seconds
+    per: :class:`float`
+        Length of the rate window in seconds
+    """
+
+    def __init__(self, rate, per=1.0, *, loop):
+        self.rate = int(rate)
+        self.per = float(per)
+        self.loop = loop
+        self._sent = deque(maxlen=self.rate)
+        self._waiters = []
+        self._counter = count()
+        self._handle = None
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _delay(self, current):
+        if len(self._sent) < self.rate:
+            return 0.0
+        return max(0.0, self._sent[0] + self.per - current)
+
+    def _record(self, current, waited):
+        self._sent.append(current)
+        self._acquired += 1
+        if waited:
+            self._delayed += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+    def _schedule(self):
+        if self._handle is not None or not self._waiters:
+            return
+        self._handle = self.loop.call_later(self._delay(time.monotonic()), self._wakeup)
+
+    def _wakeup(self):
+        self._handle = None
+        current = time.monotonic()
+        while self._waiters and not self._delay(current):
+            _, _, future, started = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._record(current, current - started)
+            future.set_result(None)
+        self._schedule()
+
+    async def acquire(self, priority=Priority.DEFAULT):
+        """|coro|
+
+        Waits until a call can be made without exceeding the rate.
+
+        Parameters
+        ----------
+        priority: :class:`Priority`
+            Priority class of the call
+        """
+        current = time.monotonic()
+        if not self._waiters and not self._delay(current):
+            self._record(current, 0)
+            return
+        future = self.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future, current))
+        self._schedule()
+        await future
+
+    def drain(self):
+        """Holds calls for the whole window, used when VK reports that the rate was exceeded anyway."""
+        self._sent.extend([time.monotonic()] * self.rate)
+
+    @property
+    def queued(self):
+        """:class:`int`: Number of calls currently waiting for a token"""
+        return sum(1 for *_, future, _ in self._waiters if not future.done())
+
+    @property
+    def stats(self):
+        """:class:`dict`: Current queue depth and wait time statistics"""
+        return {
+            'rate': self.rate,
+            'per': self.per,
+            'queued': self.queued,
+            'acquired': self._acquired,
+            'delayed': self._delayed,
+            'total_wait': self._total_wait,
+            'max_wait': self._max_wait,
+            'average_wait': self._total_wait / self._acquired if self._acquired else 0.0
+        }
+
+    def __repr__(self):
+        recent = sum(1 for sent in self._sent if sent > time.monotonic() - self.per)
+        return '<TokenBucket rate: {0.rate} per: {0.per} recent: {1} queued: {0.queued}>'.format(self, recent)
+
+
+class RateLimiter:
+    """Keeps a :class:`TokenBucket` for every access token used by the client.
+
+    Attributes
+    ----------
+    default_rate: :class:`int`
+        Rate used for tokens that were not registered with :meth:`set_rate`
+    per: :class:`float`
+        Length of the rate window in seconds
+    """
+
+    def __init__(self, *, loop, default_rate=20, per=1.0):
+        self.loop = loop
+        self.default_rate = default_rate
+        self.per = per
+        self._rates = {}
+        self._buckets = {}
+
+    def set_rate(self, token, rate):
+        """Sets the rate for the given token. ``None`` or 0 disables pacing for it."""
+        self._rates[token] = rate
+        self._buckets.pop(token, None)
+
+    def get_bucket(self, token):
+        try:
+            return self._buckets[token]
+        except KeyError:
+            rate = self._rates.get(token, self.default_rate)
+            bucket = self._buckets[token] = TokenBucket(rate, self.per, loop=self.loop) if rate else None
+            return bucket
+
+    async def acquire(self, token, priority=Priority.DEFAULT):
+        bucket = self.get_bucket(token)
+        if bucket is not None:
+            await bucket.acquire(priority)
+
+    def drain(self, token):
+        bucket = self.get_bucket(token)
+        if bucket is not None:
+            bucket.drain()
+
+    @property
+    def stats(self):
+        """:class:`dict`: :attr:`TokenBucket.stats` for every token, keyed by the last 6 symbols of the token"""
+        return {'...{}'.format(str(token)[-6:]): bucket.stats for token, bucket in self._buckets.items() if bucket is not None}
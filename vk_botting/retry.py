@@ -0,0 +1,213 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import random
+import time
+from urllib.parse import urlsplit
+
+from vk_botting.exceptions import CircuitBreakerOpen
+
+
+class CircuitBreaker:
+    """Stops requests to an endpoint after several failures in a row.
+
+    After ``recovery_timeout`` seconds one probe request is let through,
+    the breaker closes again if it succeeds.
+
+    Attributes
+    ----------
+    endpoint: :class:`str`
+        Host the breaker is guarding
+    failure_threshold: :class:`int`
+        Number of failures in a row that opens the breaker
+    recovery_timeout: :class:`float`
+        Seconds to wait before probing the endpoint again
+    """
+
+    def __init__(self, endpoint, *, failure_threshold=5, recovery_timeout=30.0):
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._rejected = 0
+
+    @property
+    def state(self):
+        """:class:`str`: Either ``'closed'``, ``'open'`` or ``'half_open'``"""
+        if self._opened_at is None:
+            return 'closed'
+        if self._probing or time.monotonic() >= self._opened_at + self.recovery_timeout:
+            return 'half_open'
+        return 'open'
+
+    def check(self):
+        """Raises :exc:`.CircuitBreakerOpen` if requests to the endpoint should not be made now.
+
+        Returns ``True`` if the request is let through as a probe, in that case it has to end
+        with :meth:`record_success` or :meth:`record_failure`, even if it is cancelled.
+        """
+        if self._opened_at is None:
+            return False
+        retry_after = self._opened_at + self.recovery_timeout - time.monotonic()
+        if self._probing or retry_after > 0:
+            self._rejected += 1
+            raise CircuitBreakerOpen(self.endpoint, max(retry_after, 0.0))
+        self._probing = True
+        return True
+
+    def record_success(self):
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self):
+        self._failures += 1
+        if self._probing or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    @property
+    def stats(self):
+        return {
+            'state': self.state,
+            'failures': self._failures,
+            'rejected': self._rejected
+        }
+
+
+class RetryBudget:
+    """Limits retries to a share of requests made during the last ``window`` seconds.
+
+    Keeps retries from multiplying load while the API is failing.
+
+    Attributes
+    ----------
+    ratio: :class:`float`
+        Share of requests that can be retried
+    min_retries: :class:`int`
+        Number of retries per window that is always allowed
+    window: :class:`int`
+        Length of the window in seconds
+    """
+
+    def __init__(self, *, ratio=0.2, min_retries=10, window=10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = int(window)
+        self._buckets = {}
+        self._exhausted = 0
+
+    def _current(self):
+        second = int(time.monotonic())
+        if second not in self._buckets:
+            for key in [key for key in self._buckets if key <= second - self.window]:
+                del self._buckets[key]
+            self._buckets[second] = [0, 0]
+        return self._buckets[second]
+
+    def record_request(self):
+        self._current()[0] += 1
+
+    def withdraw(self):
+        """Returns ``True`` and counts a retry if budget allows one, ``False`` otherwise"""
+        bucket = self._current()
+        requests = sum(b[0] for b in self._buckets.values())
+        retries = sum(b[1] for b in self._buckets.values())
+        if retries >= self.min_retries + self.ratio * requests:
+            self._exhausted += 1
+            return False
+        bucket[1] += 1
+        return True
+
+    @property
+    def stats(self):
+        self._current()
+        return {
+            'requests': sum(b[0] for b in self._buckets.values()),
+            'retries': sum(b[1] for b in self._buckets.values()),
+            'exhausted': self._exhausted
+        }
+
+
+class RetryPolicy:
+    """Decides when and how soon failed requests are retried.
+
+    Delays grow exponentially with "full jitter", so clients do not retry in sync.
+    Retries are limited by a shared :class:`RetryBudget`, and every host gets its own :class:`CircuitBreaker`.
+
+    Parameters
+    ----------
+    attempts: :class:`int`
+        Maximum number of attempts for one HTTP request
+    api_attempts: :class:`int`
+        Maximum number of attempts for one API call that VK asks to retry (too many requests, internal errors)
+    base_delay: :class:`float`
+        Upper bound of the first delay in seconds, doubled on every attempt
+    max_delay: :class:`float`
+        Upper bound of any delay in seconds
+    budget: :class:`RetryBudget`
+        Retry budget shared by all requests. Default one allows retrying 20% of requests
+    failure_threshold: :class:`int`
+        Failures in a row that open the breaker of a host
+    recovery_timeout: :class:`float`
+        Seconds an opened breaker waits before probing the host again
+    """
+
+    def __init__(self, *, attempts=5, api_attempts=10, base_delay=0.5, max_delay=30.0, budget=None, failure_threshold=5, recovery_timeout=30.0):
+        self.attempts = attempts
+        self.api_attempts = api_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget if budget is not None else RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers = {}
+
+    def backoff(self, attempt):
+        """Returns delay in seconds before the retry number ``attempt`` (starting from 0)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def get_breaker(self, url):
+        endpoint = urlsplit(url).netloc or url
+        try:
+            return self._breakers[endpoint]
+        except KeyError:
+            breaker = self._breakers[endpoint] = CircuitBreaker(endpoint, failure_threshold=self.failure_threshold, recovery_timeout=self.recovery_timeout)
+            return breaker
+
+    def can_retry(self, attempt, attempts=None):
+        if attempt + 1 >= (attempts or self.attempts):
+            return False
+        return self.budget.withdraw()
+
+    @property
+    def stats(self):
+        """:class:`dict`: Retry budget usage and state of every circuit breaker"""
+        return {
+            'budget': self.budget.stats,
+            'breakers': {endpoint: breaker.stats for endpoint, breaker in self._breakers.items()}
+        }
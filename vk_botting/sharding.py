@@ -0,0 +1,65 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import os
+import zlib
+
+READ_LIMIT = 2 ** 24
+
+
+def get_peer_id(update):
+    """Returns id of the conversation or user the update belongs to, or ``None`` if it has none"""
+    obj = update.get('object')
+    if not isinstance(obj, dict):
+        return None
+    if isinstance(obj.get('message'), dict):
+        obj = obj['message']
+    for field in ('peer_id', 'user_id', 'from_id', 'owner_id'):
+        if isinstance(obj.get(field), int):
+            return obj[field]
+    return None
+
+
+def get_shard(update, shards):
+    """Returns number of the worker the update should be handled by.
+
+    All updates of one conversation go to the same worker, so they are handled in order.
+    """
+    peer_id = get_peer_id(update)
+    if peer_id is None:
+        return zlib.crc32(str(update.get('event_id', '')).encode()) % shards
+    return abs(peer_id) % shards
+
+
+async def open_reader(fd, *, loop):
+    reader = asyncio.StreamReader(limit=READ_LIMIT, loop=loop)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader, loop=loop), os.fdopen(fd, 'rb'))
+    return reader
+
+
+async def open_writer(fd, *, loop):
+    transport, protocol = await loop.connect_write_pipe(lambda: asyncio.streams.FlowControlMixin(loop=loop), os.fdopen(fd, 'wb'))
+    return asyncio.StreamWriter(transport, protocol, None, loop)
@@ -0,0 +1,119 @@
+"""
+The MIT License (MIT)
+
+Original work Copyright (c) 2015-present Rapptz
+Modified work Copyright (c) 2019-present MrDandycorn
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from contextlib import contextmanager
+
+from vk_botting.exceptions import LoginError
+
+# Only errors that mean the token itself is invalid, errors like 27 (method is not available with group auth)
+# are properties of the called method and are returned to the caller as is
+AUTH_ERROR_CODES = frozenset((5,))
+
+
+class TokenPool:
+    """Spreads API calls across several access tokens of one group.
+
+    Every token has its own request quota, so using several tokens scales throughput linearly.
+    Tokens that fail authorization are taken out of the pool.
+
+    Normally should not be created manually, pass a list of tokens to :meth:`.Bot.run` instead.
+
+    Attributes
+    ----------
+    tokens: List[:class:`str`]
+        All tokens of the pool, including failed ones
+    strategy: :class:`str`
+        Either ``'least_loaded'`` (token with the least calls in flight is used) or ``'round_robin'``
+    """
+
+    def __init__(self, tokens, *, strategy='least_loaded'):
+        if strategy not in ('least_loaded', 'round_robin'):
+            raise ValueError('Unknown token pool strategy: {}'.format(strategy))
+        self.tokens = list(dict.fromkeys(tokens))
+        if not self.tokens:
+            raise LoginError('Token pool has to contain at least one token')
+        self.strategy = strategy
+        self._index = 0
+        self._in_flight = dict.fromkeys(self.tokens, 0)
+        self._requests = dict.fromkeys(self.tokens, 0)
+        self._failed = {}
+
+    @property
+    def healthy(self):
+        """List[:class:`str`]: Tokens that can still be used"""
+        return [token for token in self.tokens if token not in self._failed]
+
+    def get(self):
+        """Returns a token to make the next call with.
+
+        Raises
+        --------
+        vk_botting.LoginError
+            When every token in the pool failed authorization.
+        """
+        healthy = self.healthy
+        if not healthy:
+            raise LoginError('All tokens in the pool failed authorization')
+        start = self._index % len(healthy)
+        self._index += 1
+        if self.strategy == 'round_robin':
+            return healthy[start]
+        rotated = healthy[start:] + healthy[:start]
+        return min(rotated, key=self._in_flight.__getitem__)
+
+    @contextmanager
+    def use(self):
+        token = self.get()
+        self._in_flight[token] += 1
+        self._requests[token] += 1
+        try:
+            yield token
+        finally:
+            self._in_flight[token] -= 1
+
+    def check(self, token, res):
+        """Takes token out of the pool if response is an authorization error.
+
+        Returns ``True`` if the call should be retried with another token.
+        """
+        error = res.get('error') if isinstance(res, dict) else None
+        if error and error.get('error_code') in AUTH_ERROR_CODES:
+            self._failed[token] = error
+            return True
+        return False
+
+    def restore(self, token):
+        """Puts previously failed token back into the pool"""
+        self._failed.pop(token, None)
+
+    @property
+    def stats(self):
+        """:class:`dict`: Health and load of every token, keyed by the last 6 symbols of the token"""
+        return {'...{}'.format(token[-6:]): {
+            'healthy': token not in self._failed,
+            'in_flight': self._in_flight[token],
+            'requests': self._requests[token],
+            'error': self._failed.get(token)
+        } for token in self.tokens}
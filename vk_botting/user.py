@@ -49,6 +49,17 @@ class User(Messageable):
         1 for female, 2 for male, 0 for not specified
     """
 
+    __slots__ = (
+        'original_data', 'id', 'first_name', 'last_name', 'is_closed', 'can_access_closed', 'photo_id', 'verified', 'sex', 'bdate', 'city',
+        'country', 'home_town', 'has_photo', 'photo_50', 'photo_100', 'photo_200_orig', 'photo_200', 'photo_400_orig', 'photo_max',
+        'photo_max_orig', 'online', 'domain', 'has_mobile', 'contacts', 'site', 'education', 'universities', 'schools', 'status',
+        'last_seen', 'followers_count', 'common_count', 'occupation', 'nickname', 'relatives', 'relation', 'personal', 'connections',
+        'exports', 'activities', 'interests', 'music', 'movies', 'tv', 'books', 'games', 'about', 'quotes', 'can_post',
+        'can_see_all_posts', 'can_see_audio', 'can_write_private_message', 'can_send_friend_request', 'is_favorite', 'is_hidden_from_feed',
+        'timezone', 'screen_name', 'maiden_name', 'crop_photo', 'is_friend', 'friend_status', 'career', 'military', 'blacklisted',
+        'blacklisted_by_me', 'can_be_invited_group'
+    )
+
     async def _get_conversation(self):
         return self.id
 
@@ -131,6 +142,7 @@ class User(Messageable):
 
 
 class BlockedUser:
+    __slots__ = ('admin_id', 'user_id', 'unblock_date', 'reason', 'comment')
 
     def __init__(self, data):
         self._unpack(data)
@@ -144,6 +156,7 @@ class BlockedUser:
 
 
 class UnblockedUser:
+    __slots__ = ('admin_id', 'user_id', 'by_end_date')
 
     def __init__(self, data):
         self._unpack(data)
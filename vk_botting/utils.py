@@ -24,7 +24,8 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from inspect import isawaitable
-import json
+
+from vk_botting.codec import get_codec
 
 
 async def async_all(gen, *, check=isawaitable):
@@ -52,4 +53,75 @@ def find(predicate, seq):
 
 
 def to_json(obj):
-    return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+    return get_codec().dumps(obj)
+
+
+def from_json(data):
+    return get_codec().loads(data)
+
+
+MESSAGE_LIMIT = 4096
+
+_SPLIT_SEPARATORS = (
+    ('\n\n',),
+    ('\n',),
+    ('. ', '! ', '? ', '\u2026 ', '.\t', '!\t', '?\t'),
+    (' ', '\t')
+)
+
+
+def _utf16_len(text):
+    return len(text.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def _fit(text, start, limit):
+    end = min(len(text), start + limit)
+    excess = _utf16_len(text[start:end]) - limit
+    while excess > 0:
+        end -= (excess + 1) // 2
+        excess = _utf16_len(text[start:end]) - limit
+    if start + 1 < end < len(text) and '\ud800' <= text[end - 1] <= '\udbff' and '\udc00' <= text[end] <= '\udfff':
+        end -= 1
+    return end
+
+
+def split_message(text, limit=MESSAGE_LIMIT):
+    """Splits text into parts that are not longer than ``limit`` UTF-16 code units, which is how VK counts message length.
+
+    Parts are cut at paragraph boundaries if possible, then at line, sentence and word boundaries.
+    Surrogate pairs are never split. Works in linear time.
+    Always returns at least one part, long text that consists only of whitespace gives one empty part.
+
+    Parameters
+    ----------
+    text: :class:`str`
+        Text to split
+    limit: :class:`int`
+        Maximum length of one part. Defaults to 4096
+
+    Returns
+    -------
+    List[:class:`str`]
+        Parts of the text
+    """
+    if len(text) <= limit // 2 or _utf16_len(text) <= limit:
+        return [text]
+    parts = []
+    start = 0
+    length = len(text)
+    while start < length:
+        end = _fit(text, start, limit)
+        if end < length:
+            window = text[start:end]
+            for separators in _SPLIT_SEPARATORS:
+                cut = max(window.rfind(separator) + len(separator) if separator in window else -1 for separator in separators)
+                if cut > len(window) // 2:
+                    end = start + cut
+                    break
+        part = text[start:end].rstrip()
+        if part:
+            parts.append(part)
+        start = end
+        while start < length and text[start].isspace():
+            start += 1
+    return parts or ['']